@@ -1,5 +1,9 @@
+import heapq
+import operator
+import pickle
 import random
 import types
+from multiprocessing.shared_memory import ShareableList
 
 
 class InvalidArgumentValueError(Exception):
@@ -10,6 +14,10 @@ class IncorrectArgumentTypeError(Exception):
     my_message = 'Incorrect generator argument type'
 
 
+class IncorrectItemsTypeError(Exception):
+    my_message = 'Incorrect items type'
+
+
 class BaseIterator:
 
     __slots__ = ('items', 'cursor')
@@ -54,22 +62,63 @@ class BaseIterator:
 
 
 class ListIterator(BaseIterator):
-    __slots__ = ()
+    __slots__ = ('iterator', 'position')
+
+    @property
+    def cursor(self):
+        if self.iterator is None:
+            return self.position
+        return len(self.items) - 1 - self.iterator.__length_hint__()
+
+    @cursor.setter
+    def cursor(self, value):
+        self.position = value
+        self.iterator = None
+
+    def __iter__(self):
+        self._valid_items_type()
+        if self.iterator is None and isinstance(self.items, (list, tuple)):
+            self.iterator = iter(self.items)
+            self.iterator.__setstate__(self.position + 1)
+        return self if self.iterator is None else self.iterator
+
+    def __length_hint__(self):
+        return max(len(self.items) - 1 - self.cursor, 0)
 
     def _valid_items_type(self):
         if isinstance(self.items, list) and self.items != []:
             return True
 
     def __next__(self):
-        if self.cursor + 1 >= len(self.items):
+        if self.iterator is not None:
+            return next(self.iterator)
+        if self.position + 1 >= len(self.items):
             raise StopIteration
-        self.cursor += 1
-        return self.items[self.cursor]
+        self.position += 1
+        return self.items[self.position]
 
     def __getitem__(self, key):
-        self._valid_items_type()
+        if isinstance(key, slice):
+            return SliceView(self.items, *SliceView.bounds(self.items, key))
         return self.items[key]
 
+    def shard(self, n, i, strided=False):
+        if not all(
+                isinstance(x, int) and not isinstance(x, bool) for x in (n, i)
+        ):
+            raise IncorrectArgumentTypeError(
+                'Incorrect generator argument type'
+            )
+        if n < 1 or not 0 <= i < n:
+            raise InvalidArgumentValueError('Invalid generator argument value')
+        if strided:
+            return SliceView(self.items, *SliceView.bounds(
+                self.items, slice(i, None, n)
+            ))
+        start = len(self.items) * i // n
+        end = len(self.items) * (i + 1) // n
+        return SliceView(self.items, start, end - start, 1)
+
 
 class TupleIterator(ListIterator):
     __slots__ = ()
@@ -79,6 +128,60 @@ class TupleIterator(ListIterator):
             return True
 
 
+class SliceView(BaseIterator):
+    __slots__ = ('offset', 'length', 'stride')
+
+    def __init__(self, items, offset=0, length=None, stride=1):
+        if not isinstance(items, (list, tuple, ShareableList)):
+            raise IncorrectItemsTypeError('Incorrect items type')
+        super().__init__(items)
+        self.offset = offset
+        self.length = len(items) if length is None else length
+        self.stride = stride
+
+    @staticmethod
+    def bounds(items, key):
+        indices = range(len(items))[key]
+        return indices.start, len(indices), indices.step
+
+    def _indices(self):
+        return range(
+            self.offset, self.offset + self.length * self.stride, self.stride
+        )
+
+    def _valid_items_type(self):
+        return True
+
+    def __len__(self):
+        return self.length
+
+    def __next__(self):
+        if self.cursor + 1 >= self.length:
+            raise StopIteration
+        self.cursor += 1
+        return self.items[self.offset + self.cursor * self.stride]
+
+    def __getitem__(self, key):
+        indices = self._indices()[key]
+        if isinstance(key, slice):
+            return SliceView(
+                self.items, indices.start, len(indices), indices.step
+            )
+        return self.items[indices]
+
+    def __reduce__(self):
+        if isinstance(self.items, ShareableList):
+            return self.__class__, (
+                self.items, self.offset, self.length, self.stride
+            )
+        elements = [self.items[i] for i in self._indices()]
+        return self.__class__, (type(self.items)(elements),)
+
+    def __repr__(self):
+        elements = [self.items[i] for i in self._indices()]
+        return f'{self.__class__.__name__}({elements})'
+
+
 class SetIterator(BaseIterator):
     __slots__ = ()
 
@@ -92,6 +195,43 @@ class SetIterator(BaseIterator):
         return self.items.pop()
 
 
+class MergeIterator(BaseIterator):
+    __slots__ = ('key', 'unique', 'heap', 'last_key')
+
+    def __init__(self, *iterators, key=None, unique=False):
+        if not all(isinstance(x, BaseIterator) for x in iterators):
+            raise IncorrectItemsTypeError('Incorrect items type')
+        super().__init__(iterators)
+        self.key = key
+        self.unique = unique
+        self.heap = None
+        self.last_key = None
+
+    def _valid_items_type(self):
+        return True
+
+    def _push(self, source_index, source):
+        for value in source:
+            key = value if self.key is None else self.key(value)
+            heapq.heappush(self.heap, (key, source_index, value, source))
+            return
+
+    def __next__(self):
+        if self.heap is None:
+            self.heap = []
+            for source_index, source in enumerate(self.items):
+                self._push(source_index, iter(source))
+        while self.heap:
+            key, source_index, value, source = heapq.heappop(self.heap)
+            self._push(source_index, source)
+            if self.unique and self.cursor >= 0 and key == self.last_key:
+                continue
+            self.cursor += 1
+            self.last_key = key
+            return value
+        raise StopIteration
+
+
 TEST_TYPE_DATA = [
         random.sample(range(1, 7), 6),
         tuple(random.sample(range(-7, 7), 6)),
@@ -258,7 +398,156 @@ def test_tuple_iterator():
     assert test_index[3] == 7, 'Indexing fail'
 
 
+def test_slice_view():
+    for i in range(100):
+        list_arg = random.sample(range(-100, 100), 20)
+        start = random.randint(-25, 25)
+        end = random.randint(-25, 25)
+        step = random.choice([-3, -2, -1, 1, 2, 3])
+        for items in (ListIterator(list_arg), TupleIterator(tuple(list_arg))):
+            view = items[start:end:step]
+            expected = list_arg[start:end:step]
+            assert isinstance(view, SliceView), 'Slice is not a view'
+            assert view.items is items.items, 'Slice copied the storage'
+            assert len(view) == len(expected), 'View len fail'
+            assert [view[x] for x in range(len(view))] == expected, (
+                'View indexing fail'
+            )
+            assert view[::-2][1:].items is items.items, 'Nested slice copied'
+            assert list(view[::-2][1:]) == expected[::-2][1:], (
+                'Nested slicing fail'
+            )
+            assert [z for z in view] == expected, 'View is not iterator'
+            assert [z for z in view] == [], 'Tested view wasnt iterated'
+
+    try:
+        SliceView({1, 2, 3})
+    except Exception as e:
+        assert isinstance(e, IncorrectItemsTypeError), 'Invalid view items'
+
+
+def test_merge_iterator():
+    for i in range(100):
+        sources = [
+            sorted(random.sample(range(-100, 100), random.randint(0, 10)))
+            for _ in range(random.randint(1, 6))
+        ]
+        merged = MergeIterator(*(
+            ListIterator(x) if random.randint(0, 1) else TupleIterator(
+                tuple(x)
+            ) for x in sources
+        ))
+        expected = sorted(x for source in sources for x in source)
+        assert [z for z in merged] == expected, 'Merge fail'
+        assert [z for z in merged] == [], 'Tested merge wasnt iterated'
+
+        merged = MergeIterator(
+            *(ListIterator(x) for x in sources), unique=True
+        )
+        assert [z for z in merged] == sorted(set(expected)), 'Dedup fail'
+
+        merged = MergeIterator(
+            *(ListIterator(sorted(x, key=abs)) for x in sources),
+            key=abs
+        )
+        assert [abs(z) for z in merged] == sorted(abs(x) for x in expected), (
+            'Key merge fail'
+        )
+
+    try:
+        MergeIterator(ListIterator([1, 2]), [3, 4])
+    except Exception as e:
+        assert isinstance(e, IncorrectItemsTypeError), 'Invalid merge items'
+
+
+def test_shard():
+    for i in range(100):
+        list_arg = random.sample(range(-100, 100), random.randint(0, 30))
+        n = random.randint(1, 8)
+        strided = random.choice([True, False])
+        for items in (ListIterator(list_arg), TupleIterator(tuple(list_arg))):
+            shards = [items.shard(n, x, strided) for x in range(n)]
+            assert all(x.items is items.items for x in shards), (
+                'Shard copied the storage'
+            )
+            assert sorted(z for x in shards for z in x) == sorted(list_arg), (
+                'Shards are not disjoint or do not cover the items'
+            )
+            shards = [items.shard(n, x, strided) for x in range(n)]
+            restored = [pickle.loads(pickle.dumps(x)) for x in shards]
+            assert [list(x) for x in restored] == [list(x) for x in shards], (
+                'Shard pickling fail'
+            )
+
+    shared = ShareableList(random.sample(range(-100, 100), 20))
+    try:
+        shard = ListIterator(shared).shard(3, 1, strided=True)
+        data = pickle.dumps(shard)
+        assert shared.shm.name.encode() in data, 'Shared shard not by name'
+        restored = pickle.loads(data)
+        assert list(restored) == list(shared)[1::3], 'Shared shard fail'
+        restored.items.shm.close()
+    finally:
+        shared.shm.close()
+        shared.shm.unlink()
+
+    for args in ((0, 0), (2, 2), (2, -1), ('2', 0), (2, True)):
+        try:
+            ListIterator([1, 2, 3]).shard(*args)
+        except Exception as e:
+            assert isinstance(
+                e, (InvalidArgumentValueError, IncorrectArgumentTypeError)
+            ), 'Invalid shard argument'
+
+
+def test_fast_iteration():
+    for i in range(100):
+        list_arg = random.sample(range(-100, 100), 10)
+        stop = random.randint(0, 9)
+        for items in (ListIterator(list_arg), TupleIterator(tuple(list_arg))):
+            assert operator.length_hint(items) == 10, 'Length hint fail'
+            for z in items:
+                if z == list_arg[stop]:
+                    break
+            assert items.cursor == stop, 'Cursor lost on partial iteration'
+            assert operator.length_hint(items) == 9 - stop, (
+                'Length hint fail'
+            )
+            if stop < 9:
+                assert next(items) == list_arg[stop + 1], (
+                    'Resume after partial iteration fail'
+                )
+            assert [z for z in items] == list_arg[stop + 2:], (
+                'Resume after partial iteration fail'
+            )
+            assert items.cursor == 9, 'Cursor lost on full iteration'
+            items.cursor = stop
+            assert [z for z in items] == list_arg[stop + 1:], 'Cursor reset'
+
+    next_calls = []
+    list_next = ListIterator.__next__
+
+    def counting_next(self):
+        next_calls.append(1)
+        return list_next(self)
+
+    ListIterator.__next__ = counting_next
+    try:
+        for items in (
+                ListIterator(list(range(100))),
+                TupleIterator(tuple(range(100)))
+        ):
+            assert list(items) == list(range(100)), 'Fast iteration fail'
+    finally:
+        ListIterator.__next__ = list_next
+    assert next_calls == [], 'Iteration fell back to Python-level __next__'
+
+
 if __name__ == '__main__':
     test_set_iterator()
     test_list_iterator()
     test_tuple_iterator()
+    test_slice_view()
+    test_merge_iterator()
+    test_shard()
+    test_fast_iteration()
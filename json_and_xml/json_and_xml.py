@@ -1,9 +1,32 @@
+import bisect
+import bz2
+import copy
+import fcntl
+import gzip
+import hashlib
+import importlib
 import json
+import lzma
+import mmap
 import os.path
 import random
+import re
+import shutil
+import struct
+import sys
+import tempfile
+import threading
+import time
+import weakref
+from array import array
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from functools import partial
+from itertools import accumulate, islice
+from collections.abc import (
+    ItemsView, Mapping, Sequence, Set, ValuesView
+)
 from datetime import datetime
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
 
 
 class InvalidClassParameter(Exception):
@@ -34,8 +57,22 @@ class InvalidXML(Exception):
     error_message = 'Invalid xml file'
 
 
+class InvalidBinary(Exception):
+    error_massage = 'Invalid binary file'
+
+
 class InvalidFileTypeArgument(Exception):
-    error_massage = 'File type argument should be Json or XML'
+    error_massage = (
+        'File type argument should be Json, XML, Bin, Gzip, Bz2, Lzma or Range'
+    )
+
+
+class SequenceNotFound(Exception):
+    error_massage = 'Sequence with given name is not found'
+
+
+class MemoryBudgetExceeded(Exception):
+    error_massage = 'Sequence does not fit into the memory budget'
 
 
 class InappropriateTypeForFiboGeneration(Exception):
@@ -47,19 +84,802 @@ class InappropriateTypeForFiboGeneration(Exception):
 
 PATH_JSON = 'data.json'
 PATH_XML = 'data.xml'
+PATH_BIN = 'data.bin'
+PATH_GZIP = 'data.gz'
+PATH_BZ2 = 'data.bz2'
+PATH_LZMA = 'data.xz'
+PATH_RANGE = 'data.range'
+FILE_PATHS = {
+    'json': PATH_JSON, 'xml': PATH_XML, 'bin': PATH_BIN,
+    'gzip': PATH_GZIP, 'bz2': PATH_BZ2, 'lzma': PATH_LZMA,
+    'range': PATH_RANGE
+}
+CODECS = {
+    'gzip': ('gzip', gzip), 'bz2': ('bz2', bz2), 'lzma': ('lzma', lzma)
+}
+BINARY_TYPES = ('bin',) + tuple(CODECS)
+APPENDABLE_TYPES = ('json', 'xml', 'bin')
+PARALLEL_TYPES = ('json', 'xml')
 DATE_STAMP = '%d-%m-%Y %H:%M'
+CHUNK_SIZE = 1000
+HEADER_SUFFIX = '.meta'
+TEMP_SUFFIX = '.tmp'
+LOCK_SUFFIX = '.lock'
+STORE_INDEX = '.index'
+BUNDLE_BUFFER_SIZE = 2 ** 20
+BUNDLE_KINDS = ('range', 'fibonacci')
+BIN_MAGIC = b'SEQB'
+BIN_VERSION = 1
+BIN_HEADER = struct.Struct('<4sBc2xQQQQ')
+BIN_DATA_OFFSET = 64
+BIN_ESCAPE = -2 ** 63
+BIN_ESCAPE_LEN = struct.Struct('<I')
+INDEX_SUFFIX = '.idx'
+INDEX_MAGIC = b'SEQI'
+INDEX_VERSION = 1
+INDEX_HEADER = struct.Struct('<4sBc2xIQQQQQ')
+INDEX_DATA_OFFSET = 64
+PACKED_MAGIC = b'SEQZ'
+PACKED_ENCODING = 'zigzag-delta-varint'
+PACKED_BLOCK_SIZE = 2 ** 16
+JSON_TEMPLATES = ('    {0}', '    "{0}": {0}')
+XML_TEMPLATES = (
+    '        <elem>{0}</elem>', '        <elem id="{0}">{0}</elem>'
+)
+XML_PROLOGUE = '<?xml version="1.0" ?>\n<generated_data>\n    <sequence>'
+ASYNC_LIMIT = 8
+FILE_LOCKS = {}
+FILE_LOCKS_GUARD = threading.Lock()
+ASYNC_SEMAPHORES = weakref.WeakKeyDictionary()
+MAX_CACHED_ELEMENTS = 10 ** 6
+MAX_CACHED_ARTIFACTS = 1024
+MAX_CACHED_BYTES = 256 * 2 ** 20
+CACHED_ITEM_SIZE = sys.getsizeof(2 ** 30)
+RACY_WINDOW_NS = 2 * 10 ** 7
+POINTER_SIZE = struct.calcsize('P')
+OBSERVERS = []
+NO_PHASE = nullcontext()
+BIG_INT_PATTERN = re.compile(rb'\d{19}')
+SEQ_LEN_PATTERN = re.compile(rb'"seq_len": (\d+)')
+META_TAIL_SIZE = 4096
+
+
+def set_async_limit(limit):
+    global ASYNC_LIMIT
+    if not isinstance(limit, int) or isinstance(limit, bool):
+        raise IncorrectArgumentTypeError('Incorrect generator argument type')
+    if limit < 1:
+        raise InvalidArgumentValueError('Invalid generator argument value')
+    ASYNC_LIMIT = limit
+    ASYNC_SEMAPHORES.clear()
+
+
+def _async_semaphore():
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    if loop not in ASYNC_SEMAPHORES:
+        ASYNC_SEMAPHORES[loop] = asyncio.Semaphore(ASYNC_LIMIT)
+    return ASYNC_SEMAPHORES[loop]
+
+
+def _escape_xml(text):
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace(
+        '>', '&gt;'
+    )
+
+
+@contextmanager
+def _atomic_write(file_path, mode='w', buffering=-1):
+    temp_path = (
+        f'{file_path}.{os.getpid()}.{threading.get_ident()}{TEMP_SUFFIX}'
+    )
+    try:
+        with open(temp_path, mode, buffering) as file:
+            yield file
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, file_path)
+    finally:
+        if os.path.isfile(temp_path):
+            os.remove(temp_path)
+
+
+def _file_lock(file_path):
+    with FILE_LOCKS_GUARD:
+        return FILE_LOCKS.setdefault(file_path, threading.RLock())
+
+
+def _file_hash(file_path):
+    content_hash = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 16), b''):
+            content_hash.update(block)
+    return content_hash.hexdigest()
+
+
+def _stored_header(file_path):
+    header_path = file_path + HEADER_SUFFIX
+    try:
+        with open(header_path, 'r') as header_file:
+            header = json.load(header_file)
+        file_stat = os.stat(file_path)
+        header_stat = os.stat(header_path)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(header, dict) or (
+        header.get('size'), header.get('mtime_ns')
+    ) != (file_stat.st_size, file_stat.st_mtime_ns):
+        return None
+    if header_stat.st_mtime_ns <= file_stat.st_mtime_ns and (
+        _file_hash(file_path) != header.get('hash')
+    ):
+        return None
+    return header if isinstance(header.get('meta'), dict) else None
+
+
+def _remove_files(*file_paths):
+    for file_path in file_paths:
+        for path in (
+                file_path, file_path + HEADER_SUFFIX,
+                file_path + INDEX_SUFFIX
+        ):
+            if os.path.isfile(path):
+                os.remove(path)
+
+
+class RangeListView(Sequence):
+    __slots__ = ('indices',)
+    container = list
+
+    def __init__(self, indices):
+        self.indices = indices
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self.__class__(self.indices[key])
+        return self.indices[key]
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __iter__(self):
+        return iter(self.indices)
+
+    def __contains__(self, value):
+        return value in self.indices
+
+    def __eq__(self, other):
+        if isinstance(other, self.__class__):
+            return self.indices == other.indices
+        if isinstance(other, self.container):
+            return len(other) == len(self.indices) and all(
+                x == y for x, y in zip(self.indices, other)
+            )
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.indices})'
+
+
+class RangeTupleView(RangeListView):
+    __slots__ = ()
+    container = tuple
+
+
+class RangeSetView(Set):
+    __slots__ = ('indices',)
+
+    def __init__(self, indices):
+        self.indices = indices
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __iter__(self):
+        return iter(self.indices)
+
+    def __contains__(self, value):
+        return value in self.indices
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.indices})'
+
+
+class RangeDictView(Mapping):
+    __slots__ = ('indices',)
+
+    def __init__(self, indices):
+        self.indices = indices
+
+    def __getitem__(self, key):
+        try:
+            value = int(key)
+        except (TypeError, ValueError):
+            raise KeyError(key)
+        if not isinstance(key, str) or str(value) != key or (
+            value not in self.indices
+        ):
+            raise KeyError(key)
+        return value
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __iter__(self):
+        return (str(i) for i in self.indices)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.indices})'
+
+
+class CompactValuesView(ValuesView):
+    __slots__ = ()
+
+    def __iter__(self):
+        return iter(self._mapping.elements)
+
+
+class CompactItemsView(ItemsView):
+    __slots__ = ()
+
+    def __iter__(self):
+        elements = self._mapping.elements
+        return zip(map(str, elements), elements)
+
+
+class CompactDictView(Mapping):
+    __slots__ = ('elements', 'ordered')
+
+    def __init__(self, elements):
+        self.elements = array('q', elements)
+        self.ordered = array('q', sorted(set(self.elements)))
+        if len(self.ordered) != len(self.elements):
+            self.elements = array('q', dict.fromkeys(self.elements))
+        if self.ordered == self.elements:
+            self.ordered = self.elements
+
+    def __getitem__(self, key):
+        try:
+            value = int(key)
+        except (TypeError, ValueError):
+            raise KeyError(key)
+        index = bisect.bisect_left(self.ordered, value)
+        if not isinstance(key, str) or str(value) != key or (
+            index == len(self.ordered) or self.ordered[index] != value
+        ):
+            raise KeyError(key)
+        return value
+
+    def __len__(self):
+        return len(self.elements)
+
+    def __iter__(self):
+        return map(str, self.elements)
+
+    def values(self):
+        return CompactValuesView(self)
+
+    def items(self):
+        return CompactItemsView(self)
+
+    def to_dict(self):
+        return dict(zip(map(str, self.elements), self.elements))
+
+    def __eq__(self, other):
+        if isinstance(other, CompactDictView):
+            return self.ordered == other.ordered
+        return super().__eq__(other)
+
+    __hash__ = None
+
+    def __sizeof__(self):
+        size = object.__sizeof__(self) + self.elements.__sizeof__()
+        if self.ordered is not self.elements:
+            size += self.ordered.__sizeof__()
+        return size
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.elements.tolist()})'
+
+
+RANGE_VIEWS = {
+    'list': RangeListView, 'tuple': RangeTupleView,
+    'set': RangeSetView, 'dict': RangeDictView
+}
+
+
+class WideIndexView(Sequence):
+    __slots__ = ('data', 'width')
+
+    def __init__(self, data, width):
+        self.data = data
+        self.width = width
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self[i] for i in range(*key.indices(len(self)))]
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError('index out of range')
+        offset = key * self.width
+        return int.from_bytes(
+            self.data[offset:offset + self.width], sys.byteorder, signed=True
+        )
+
+    def __len__(self):
+        return len(self.data) // self.width
+
+    def __repr__(self):
+        return (
+            f'{self.__class__.__name__}(width={self.width}, len={len(self)})'
+        )
+
+
+class GenerationCache:
+    __slots__ = (
+        'max_elements', 'max_artifacts', 'payloads', 'artifacts', 'size',
+        'hits', 'misses', 'artifact_hits', 'artifact_misses', 'lock'
+    )
+
+    def __init__(
+            self, max_elements=MAX_CACHED_ELEMENTS,
+            max_artifacts=MAX_CACHED_ARTIFACTS
+    ):
+        self.max_elements = max_elements
+        self.max_artifacts = max_artifacts
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        self.payloads = OrderedDict()
+        self.artifacts = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.artifact_hits = 0
+        self.artifact_misses = 0
+
+    def get_payload(self, key):
+        with self.lock:
+            payload = self.payloads.get(key)
+            if payload is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.payloads.move_to_end(key)
+            return payload
+
+    def put_payload(self, key, payload):
+        if len(payload[0]) > self.max_elements:
+            return
+        with self.lock:
+            if key in self.payloads:
+                self.size -= len(self.payloads.pop(key)[0])
+            self.payloads[key] = payload
+            self.size += len(payload[0])
+            while self.size > self.max_elements:
+                self.size -= len(self.payloads.popitem(last=False)[1][0])
+
+    def get_artifact(self, spec):
+        with self.lock:
+            artifact = self.artifacts.get(spec)
+            if artifact is not None:
+                self.artifacts.move_to_end(spec)
+            return artifact
+
+    def put_artifact(self, spec, artifact):
+        with self.lock:
+            self.artifacts[spec] = artifact
+            self.artifacts.move_to_end(spec)
+            while len(self.artifacts) > self.max_artifacts:
+                self.artifacts.popitem(last=False)
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'artifact_hits': self.artifact_hits,
+            'artifact_misses': self.artifact_misses,
+            'payloads': len(self.payloads),
+            'artifacts': len(self.artifacts),
+            'size': self.size
+        }
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.max_elements})'
+
+
+GENERATION_CACHE = GenerationCache()
+
+
+class ReadCache:
+    __slots__ = ('max_bytes', 'payloads', 'size', 'hits', 'misses', 'lock')
+
+    def __init__(self, max_bytes=MAX_CACHED_BYTES):
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        self.payloads = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def file_key(file_path):
+        file_stat = os.stat(file_path)
+        if time.time_ns() - file_stat.st_mtime_ns < RACY_WINDOW_NS:
+            return None
+        return (
+            file_stat.st_dev, file_stat.st_ino, file_stat.st_mtime_ns,
+            file_stat.st_size
+        )
+
+    @staticmethod
+    def _payload_size(payload):
+        data = payload[-1]
+        if isinstance(data, CompactDictView):
+            return sys.getsizeof(data)
+        item_size = CACHED_ITEM_SIZE * (3 if isinstance(data, dict) else 1)
+        return sys.getsizeof(data) + len(data) * item_size
+
+    def get(self, key):
+        with self.lock:
+            cached = self.payloads.get(key)
+            if cached is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.payloads.move_to_end(key)
+            return cached[0]
+
+    def put(self, key, payload):
+        payload_size = self._payload_size(payload)
+        if payload_size > self.max_bytes:
+            return
+        with self.lock:
+            if key in self.payloads:
+                self.size -= self.payloads.pop(key)[1]
+            self.payloads[key] = (payload, payload_size)
+            self.size += payload_size
+            while self.size > self.max_bytes:
+                self.size -= self.payloads.popitem(last=False)[1][1]
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'payloads': len(self.payloads),
+            'size': self.size
+        }
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.max_bytes})'
+
+
+READ_CACHE = ReadCache()
+
+
+class SerialiserBackend:
+    __slots__ = ('module',)
+    name = None
+
+    def __init__(self):
+        self.module = importlib.import_module(self.name)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}()'
+
+
+class JsonBackend(SerialiserBackend):
+    __slots__ = ()
+    name = 'json'
+
+    @property
+    def errors(self):
+        return (ValueError,)
+
+    def load(self, file):
+        return self.module.load(file)
+
+    def dump(self, data, file):
+        self.module.dump(data, file, indent=2)
+
+
+class OrjsonBackend(JsonBackend):
+    __slots__ = ()
+    name = 'orjson'
+
+    def load(self, file):
+        data = file.read()
+        if BIG_INT_PATTERN.search(data) is not None:
+            return json.loads(data)
+        return self.module.loads(data)
+
+    def dump(self, data, file):
+        try:
+            data = self.module.dumps(data, option=(
+                self.module.OPT_INDENT_2 | self.module.OPT_NON_STR_KEYS
+            ))
+        except TypeError:
+            return json.dump(data, file, indent=2)
+        file.write(data.decode())
+
+
+class EtreeBackend(SerialiserBackend):
+    __slots__ = ()
+    name = 'xml.etree.ElementTree'
+
+    @property
+    def errors(self):
+        return (self.module.ParseError,)
+
+    def load(self, file):
+        return self.module.parse(file)
+
+    def iterparse(self, file, events):
+        return self.module.iterparse(file, events=events)
+
+    def dump(self, data, file):
+        file.write(self.module.tostring(data.getroot(), encoding='unicode'))
+
+
+class LxmlBackend(EtreeBackend):
+    __slots__ = ()
+    name = 'lxml.etree'
+
+
+class SerialiserRegistry:
+    __slots__ = ('backends', 'active')
+
+    def __init__(self, backends):
+        self.backends = {
+            file_type: list(backend_classes)
+            for file_type, backend_classes in backends.items()
+        }
+        self.active = {}
+
+    def _backend_classes(self, file_type):
+        if file_type not in self.backends:
+            raise InvalidFileTypeArgument(
+                'File type argument should be Json, XML, Bin, Gzip, Bz2, Lzma'
+                ' or Range'
+            )
+        return self.backends[file_type]
+
+    def register(self, file_type, backend_class):
+        self._backend_classes(file_type).insert(0, backend_class)
+        self.active.pop(file_type, None)
+
+    def available(self, file_type):
+        names = []
+        for backend_class in self._backend_classes(file_type):
+            try:
+                importlib.import_module(backend_class.name)
+            except ImportError:
+                continue
+            names.append(backend_class.name)
+        return names
+
+    def use(self, file_type, name=None):
+        self.active.pop(file_type, None)
+        if name is None:
+            return self.get(file_type)
+        for backend_class in self._backend_classes(file_type):
+            if backend_class.name == name:
+                self.active[file_type] = backend_class()
+                return self.active[file_type]
+        raise InvalidArgumentValueError('Invalid generator argument value')
+
+    def get(self, file_type):
+        backend = self.active.get(file_type)
+        if backend is None:
+            for backend_class in self._backend_classes(file_type):
+                try:
+                    backend = backend_class()
+                except ImportError:
+                    continue
+                break
+            self.active[file_type] = backend
+        return backend
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({list(self.backends)})'
+
+
+SERIALISERS = SerialiserRegistry({
+    'json': (OrjsonBackend, JsonBackend),
+    'xml': (LxmlBackend, EtreeBackend)
+})
+
+
+class VarintStream:
+    __slots__ = ('file', 'data', 'position')
+
+    def __init__(self, file):
+        self.file = file
+        self.data = b''
+        self.position = 0
+
+    def _fill(self):
+        block = self.file.read(PACKED_BLOCK_SIZE)
+        if not block:
+            raise InvalidBinary('Invalid binary file')
+        self.data = self.data[self.position:] + block
+        self.position = 0
+
+    def read_bytes(self, size):
+        while len(self.data) - self.position < size:
+            self._fill()
+        self.position += size
+        return self.data[self.position - size:self.position]
+
+    def _decode(self, count):
+        data = self.data
+        position = self.position
+        block = data[position:position + count]
+        if len(block) == count and (not block or max(block) < 0x80):
+            self.position += count
+            return list(block)
+        values = []
+        end = len(data)
+        while len(values) < count:
+            value = shift = 0
+            index = position
+            while index < end:
+                byte = data[index]
+                index += 1
+                value |= (byte & 0x7f) << shift
+                if byte < 0x80:
+                    break
+                shift += 7
+            else:
+                break
+            values.append(value)
+            position = index
+        self.position = position
+        return values
+
+    def read_varints(self, count):
+        values = self._decode(count)
+        while len(values) < count:
+            self._fill()
+            values += self._decode(count - len(values))
+        return values
+
+    def read_rest(self):
+        blocks = [self.data[self.position:]]
+        for block in iter(lambda: self.file.read(PACKED_BLOCK_SIZE), b''):
+            blocks.append(block)
+        self.data = b''
+        self.position = 0
+        return b''.join(blocks)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.file!r})'
+
+
+class PhaseTimer:
+    __slots__ = ('generator', 'event', 'start')
+
+    def __init__(self, generator, event):
+        self.generator = generator
+        self.event = event
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self.event
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.event['seconds'] = time.perf_counter() - self.start
+        if exc_type is not None:
+            self.event['error'] = exc_type.__name__
+        self.generator._emit(self.event)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.event['phase']!r})"
+
+
+class MetricsExporter:
+    __slots__ = ('path', 'metrics_format', 'file', 'counters', 'lock')
+
+    def __init__(self, path, metrics_format='jsonl'):
+        if metrics_format not in ('jsonl', 'prometheus'):
+            raise InvalidArgumentValueError('Invalid generator argument value')
+        self.path = path
+        self.metrics_format = metrics_format
+        self.file = None
+        self.counters = {}
+        self.lock = threading.Lock()
+        if metrics_format == 'jsonl':
+            self.file = open(path, 'a')
+
+    def __call__(self, event):
+        with self.lock:
+            if self.file is not None:
+                self.file.write(json.dumps(event) + '\n')
+                return self.file.flush()
+            labels = (('generator', event['generator']),)
+            if event['event'] == 'cache':
+                self._count('sequence_cache_events_total', labels + (
+                    ('cache', event['cache']), ('outcome', event['outcome'])
+                ))
+                return None
+            phase_labels = labels + (('phase', event['phase']),)
+            self._count('sequence_phase_calls_total', phase_labels)
+            self._count(
+                'sequence_phase_seconds_total', phase_labels,
+                event['seconds']
+            )
+            for key in ('bytes_written', 'bytes_read'):
+                if key in event:
+                    self._count(f'sequence_{key}_total', labels, event[key])
+
+    def _count(self, metric, labels, value=1):
+        key = (metric, labels)
+        self.counters[key] = self.counters.get(key, 0) + value
+
+    def render(self):
+        lines = []
+        metric = None
+        for (name, labels), value in sorted(self.counters.items()):
+            if name != metric:
+                metric = name
+                lines.append(f'# TYPE {name} counter')
+            label_text = ','.join(
+                f'{key}="{label}"' for key, label in labels
+            )
+            lines.append(f'{name}{{{label_text}}} {value}')
+        return '\n'.join(lines) + '\n'
+
+    def flush(self):
+        with self.lock:
+            if self.file is not None:
+                return self.file.flush()
+            with _atomic_write(self.path) as file:
+                file.write(self.render())
+
+    def close(self):
+        self.flush()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __repr__(self):
+        return (
+            f'{self.__class__.__name__}({self.path!r}, '
+            f'{self.metrics_format!r})'
+        )
 
 
 class BaseSequenceGenerator:
     __slots__ = (
         'max_sequence', 'sequence', 'element_type', 'appropriate_seq_type',
         'loaded_data', 'meta_arg_1', 'meta_arg_2', 'meta_arg_3', 'max', 'min',
-        'meta_arg_4', 'seq_from_file', 'generator_name', 'len', 'seq_type'
+        'meta_arg_4', 'seq_from_file', 'generator_name', 'len', 'seq_type',
+        'generation_spec', 'file_paths', 'incremental', 'memory_budget',
+        'observers', 'bundle'
     )
 
-    def __init__(self, max_sequence=100):
+    def __init__(self, max_sequence=100, memory_budget=None):
         self.__valid_max_sequence_arg(max_sequence)
+        self.__valid_memory_budget_arg(memory_budget)
         self.max_sequence = max_sequence
+        self.memory_budget = memory_budget
         self.sequence = None
         self.element_type = None
         self.max = None,
@@ -74,6 +894,67 @@ class BaseSequenceGenerator:
         self.seq_from_file = None
         self.seq_type = 'list'
         self.generator_name = 'range_generator'
+        self.generation_spec = None
+        self.file_paths = FILE_PATHS
+        self.incremental = True
+        self.observers = ()
+        self.bundle = None
+
+    @staticmethod
+    def __valid_memory_budget_arg(memory_budget):
+        if memory_budget is None:
+            return
+        if not isinstance(memory_budget, int) or isinstance(
+                memory_budget, bool
+        ):
+            raise IncorrectArgumentTypeError(
+                'Incorrect generator argument type'
+            )
+        if memory_budget < 1:
+            raise InvalidArgumentValueError('Invalid generator argument value')
+
+    def _check_memory_budget(self, seq_len, bit_length=62):
+        if self.memory_budget is not None and seq_len * (
+            POINTER_SIZE + sys.getsizeof(1 << bit_length)
+        ) > self.memory_budget:
+            raise MemoryBudgetExceeded(
+                'Sequence does not fit into the memory budget'
+            )
+
+    def _check_fibonacci_budget(self, fibonacci_pair, fib_len):
+        if self.memory_budget is not None:
+            self._check_memory_budget(fib_len, max(
+                abs(self.fibonacci_term(fibonacci_pair, index)).bit_length()
+                for index in (0, 1, fib_len - 1)
+            ))
+
+    def add_observer(self, observer):
+        self.observers += (observer,)
+
+    def remove_observer(self, observer):
+        self.observers = tuple(x for x in self.observers if x != observer)
+
+    def _phase(self, phase, **fields):
+        if not (self.observers or OBSERVERS):
+            return NO_PHASE
+        return PhaseTimer(self, {'event': 'phase', 'phase': phase, **fields})
+
+    def _emit(self, event):
+        event['generator'] = self.__class__.__name__
+        for observer in self.observers + tuple(OBSERVERS):
+            observer(event)
+
+    def _emit_cache(self, cache, hit):
+        if self.observers or OBSERVERS:
+            self._emit({
+                'event': 'cache', 'cache': cache,
+                'outcome': 'hit' if hit else 'miss'
+            })
+
+    def _release_buffers(self):
+        self.sequence = None
+        self.loaded_data = None
+        self.seq_from_file = None
 
     @staticmethod
     def __valid_max_sequence_arg(max_sequence):
@@ -133,121 +1014,244 @@ class BaseSequenceGenerator:
                 'Incorrect generator argument type'
             )
 
+    @staticmethod
+    def _fibonacci_numbers(index):
+        fib_n, fib_next = 0, 1
+        for bit in bin(index)[2:]:
+            fib_2n = fib_n * (2 * fib_next - fib_n)
+            fib_2n_next = fib_n * fib_n + fib_next * fib_next
+            if bit == '1':
+                fib_n, fib_next = fib_2n_next, fib_2n + fib_2n_next
+            else:
+                fib_n, fib_next = fib_2n, fib_2n_next
+        return fib_n, fib_next
+
+    @classmethod
+    def _valid_fibonacci_index(cls, fibonacci_pair, *indexes):
+        cls._invalid_fibonacci_pair(fibonacci_pair)
+        if not all(
+                isinstance(x, int) and not isinstance(x, bool) for x in indexes
+        ):
+            raise IncorrectArgumentTypeError(
+                'Incorrect generator argument type'
+            )
+        if any(x < 0 for x in indexes) or indexes != tuple(sorted(indexes)):
+            raise InvalidArgumentValueError(
+                'Invalid generator argument value'
+            )
+
+    @classmethod
+    def fibonacci_term(cls, fibonacci_pair, index):
+        cls._valid_fibonacci_index(fibonacci_pair, index)
+        fib_n, fib_next = cls._fibonacci_numbers(index)
+        return (
+            fibonacci_pair[0] * (fib_next - fib_n) + fibonacci_pair[1] * fib_n
+        )
+
+    @classmethod
+    def fibonacci_window(cls, fibonacci_pair, start, end):
+        cls._valid_fibonacci_index(fibonacci_pair, start, end)
+        fib_n, fib_next = cls._fibonacci_numbers(start)
+        fib_1 = fibonacci_pair[0] * (fib_next - fib_n) + (
+            fibonacci_pair[1] * fib_n
+        )
+        fib_2 = fibonacci_pair[0] * fib_n + fibonacci_pair[1] * fib_next
+        for _ in range(start, end):
+            yield fib_1
+            fib_1, fib_2 = fib_2, fib_1 + fib_2
+
     def _fibonacci_generator(self, fibonacci_pair, fib_index):
         self.generator_name = 'fibonacci_generator'
         if not self._invalid_fibonacci_pair(
                 fibonacci_pair
         ) and not self._invalid_args(fib_index, generator_type='fibonacci'):
             fib_1, fib_2 = fibonacci_pair[0], fibonacci_pair[1]
-            self.min = fib_1
+            self.min = self.max = fib_1
             self.element_type = fib_1
             for _ in self._range_generator(0, fib_index):
-                self.max = fib_1
+                self.min = min(self.min, fib_1)
+                self.max = max(self.max, fib_1)
                 yield fib_1
                 fib_1, fib_2 = fib_2, fib_1 + fib_2
 
+    def _meta_to_write(self, file_path):
+        if self.bundle is not None:
+            date_created = date_modified = self.bundle.date_stamp
+        else:
+            date_created = datetime.fromtimestamp(
+                os.path.getctime(file_path)
+            ).strftime(DATE_STAMP)
+            date_modified = datetime.fromtimestamp(
+                os.path.getmtime(file_path)
+            ).strftime(DATE_STAMP)
+        return {
+            'generator_name': self.generator_name,
+            'seq_type': self.seq_type,
+            'seq_len': self.len,
+            'el_type': type(self.element_type).__name__,
+            'date_created': date_created,
+            'date_modified': date_modified,
+            'author': self.__class__.__name__,
+            'min_element': self.min,
+            'max_element': self.max
+        }
+
     def _data_to_write(self, file_path):
-        date_created = datetime.fromtimestamp(
-            os.path.getctime(file_path)
-        ).strftime(DATE_STAMP)
-        date_modified = datetime.fromtimestamp(
-            os.path.getmtime(file_path)
-        ).strftime(DATE_STAMP)
         if isinstance(self.sequence, set):
             self.sequence = tuple(self.sequence)
         file_data = {
             'sequence': self.sequence,
-            'meta': {
-                'generator_name': self.generator_name,
-                'seq_type': self.seq_type,
-                'seq_len': self.len,
-                'el_type': type(self.element_type).__name__,
-                'date_created': date_created,
-                'date_modified': date_modified,
-                'author': self.__class__.__name__,
-                'min_element': self.min,
-                'max_element': self.max
-            }
+            'meta': self._meta_to_write(file_path)
         }
         return file_data
 
-    def _serialise_xml_data(self):
-        generated_data = ET.Element('generated_data')
-        for main_key in self._range_generator(
-                0,
-                len(self._data_to_write(PATH_XML).keys())
-        ):
-            sub_name = ET.SubElement(
-                generated_data,
-                f'{list(self._data_to_write(PATH_XML).keys())[main_key]}'
-            )
-            sub_name.text = None
-
-        for seq_elem in self._range_generator(0, len(self.sequence)):
-            if self._data_to_write(PATH_XML)['meta']['seq_type'] == 'dict':
-                elem = ET.SubElement(
-                    generated_data[0], 'elem',
-                    id=str(tuple(self.sequence.keys())[seq_elem])
-                )
-                elem.text = str(tuple(self.sequence.values())[seq_elem])
+    def _tracked_elements(self, elements):
+        seq_len = 0
+        min_element = max_element = None
+        for element in elements:
+            if seq_len == 0:
+                min_element = max_element = element
             else:
-                elem = ET.SubElement(generated_data[0], 'elem')
-                elem.text = str(self.sequence[seq_elem])
-        for i in self._range_generator(
-                0,
-                len(self._data_to_write(PATH_XML)['meta'].keys())
-        ):
-            sub_meta = ET.SubElement(
-                generated_data[1],
-                f"{list(self._data_to_write(PATH_XML)['meta'].keys())[i]}"
-            )
-            sub_meta.text = str(
-                list(self._data_to_write(PATH_XML)['meta'].values())[i]
-            )
-        xml_str = minidom.parseString(
-            ET.tostring(generated_data)
-        ).toprettyxml(indent="    ")
-        return xml_str
+                min_element = min(min_element, element)
+                max_element = max(max_element, element)
+            seq_len += 1
+            yield element
+        self.len = seq_len
+        self.min = min_element
+        self.max = max_element
+        if self.seq_type == 'dict':
+            self.min = str(self.min)
+            self.max = str(self.max)
 
-    def _valid_file(self, file_to_create, file):
-        try:
-            if file_to_create == PATH_JSON:
-                self.loaded_data = json.load(file)
-            elif file_to_create == PATH_XML:
-                self.loaded_data = ET.parse(file)
-            return self.loaded_data
-        except (ValueError, ET.ParseError):
-            return False
+    def _json_meta_text(self, file_path):
+        meta = json.dumps(self._meta_to_write(file_path), indent=2)
+        return ',\n  "meta": ' + meta.replace('\n', '\n  ') + '\n}'
+
+    def _xml_meta_lines(self, file_path):
+        lines = ['    <meta>']
+        for key, value in self._meta_to_write(file_path).items():
+            lines.append(f'        <{key}>{_escape_xml(str(value))}</{key}>')
+        lines.append('    </meta>\n</generated_data>\n')
+        return lines
+
+    def _stream_json_data(self, file, elements):
+        brackets = '{}' if self.seq_type == 'dict' else '[]'
+        template = JSON_TEMPLATES[self.seq_type == 'dict']
+        chunk = []
+        separator = '\n'
+        file.write('{\n  "sequence": ' + brackets[0])
+        for element in self._tracked_elements(elements):
+            chunk.append(template.format(element))
+            if len(chunk) == CHUNK_SIZE:
+                file.write(separator + ',\n'.join(chunk))
+                chunk = []
+                separator = ',\n'
+        if chunk:
+            file.write(separator + ',\n'.join(chunk))
+        file.write(('\n  ' if self.len else '') + brackets[1])
+        file.write(self._json_meta_text(file.name))
+
+    def _serialise_xml_data(self, file, elements):
+        template = XML_TEMPLATES[self.seq_type == 'dict']
+        chunk = [XML_PROLOGUE]
+        for element in elements:
+            chunk.append(template.format(element))
+            if len(chunk) == CHUNK_SIZE:
+                file.write('\n'.join(chunk) + '\n')
+                chunk = []
+        if len(chunk) == 1 and chunk[0].endswith('<sequence>'):
+            chunk[0] = chunk[0][:-1] + '/>'
+        else:
+            chunk.append('    </sequence>')
+        chunk.extend(self._xml_meta_lines(file.name))
+        file.write('\n'.join(chunk))
+
+    def _serialise_parallel_data(
+            self, file, file_type, spec, seq_len, workers
+    ):
+        from concurrent.futures import ProcessPoolExecutor
+
+        is_dict = self.seq_type == 'dict'
+        if file_type == 'json':
+            template = JSON_TEMPLATES[is_dict]
+            separator = ',\n'
+            prefix = '{\n  "sequence": ' + ('{' if is_dict else '[') + '\n'
+            suffix = '\n  ' + ('}' if is_dict else ']')
+        else:
+            template = XML_TEMPLATES[is_dict]
+            separator = '\n'
+            prefix = XML_PROLOGUE + '\n'
+            suffix = '\n    </sequence>'
+        shard_len = max(CHUNK_SIZE, -(-seq_len // (workers * 4)))
+        shards = [
+            (spec, i, min(i + shard_len, seq_len), template, separator)
+            for i in range(0, seq_len, shard_len)
+        ]
+        self.len = 0
+        file.write(prefix)
+        with ProcessPoolExecutor(workers) as executor:
+            for text, shard_len, shard_min, shard_max in executor.map(
+                    _serialise_shard, shards
+            ):
+                file.write((separator if self.len else '') + text)
+                if self.len == 0:
+                    self.min, self.max = shard_min, shard_max
+                else:
+                    self.min = min(self.min, shard_min)
+                    self.max = max(self.max, shard_max)
+                self.len += shard_len
+        file.write(suffix)
+        if is_dict:
+            self.min = str(self.min)
+            self.max = str(self.max)
+        if file_type == 'json':
+            file.write(self._json_meta_text(file.name))
+        else:
+            file.write('\n' + '\n'.join(self._xml_meta_lines(file.name)))
+
+    def _valid_file(self, file_to_create, file):
+        file_type = 'json' if file_to_create == self.file_paths.get(
+            'json'
+        ) else 'xml'
+        backend = SERIALISERS.get(file_type)
+        try:
+            self.loaded_data = backend.load(file)
+            return self.loaded_data
+        except (ValueError, *backend.errors):
+            return False
 
     def _write_data(self, file_to_create, file):
         file.seek(0)
         file.truncate()
-        if file_to_create == PATH_JSON:
-            return json.dump(self._data_to_write(PATH_JSON), file, indent=2)
-        elif file_to_create == PATH_XML:
-            return file.write(self._serialise_xml_data())
+        if file_to_create == self.file_paths.get('json'):
+            data = self._data_to_write(file.name)
+            if isinstance(data['sequence'], CompactDictView):
+                data['sequence'] = data['sequence'].to_dict()
+            return SERIALISERS.get('json').dump(data, file)
+        elif file_to_create == self.file_paths.get('xml'):
+            return self._serialise_xml_data(file, self.sequence)
 
     def _overwrite_metadata_only(self, file_to_create, file):
         file.seek(0)
         file.truncate()
-        if file_to_create == PATH_JSON:
+        if file_to_create == self.file_paths.get('json'):
             self.loaded_data['meta'] = self._data_to_write(
                 file_to_create
             )['meta']
-            return json.dump(self.loaded_data, file, indent=2)
-        elif file_to_create == PATH_XML:
+            return SERIALISERS.get('json').dump(self.loaded_data, file)
+        elif file_to_create == self.file_paths.get('xml'):
             root = self.loaded_data.getroot()
             value_tuple = tuple(
                 self._data_to_write(file_to_create)['meta'].values()
             )
             for i in self._range_generator(0, len(value_tuple)):
                 root[1][i].text = str(value_tuple[i])
-            return self.loaded_data.write(file_to_create)
+            return SERIALISERS.get('xml').dump(self.loaded_data, file)
 
     def _is_need_to_generate_new_info(
             self, file_to_create, first_arg, second_arg, third_arg, fourth_arg
     ):
-        if file_to_create == PATH_XML:
+        if file_to_create == self.file_paths.get('xml'):
             meta_info = self.loaded_data.findall('meta')
             path_tuple = (first_arg, second_arg, third_arg, fourth_arg)
             value_list = []
@@ -261,7 +1265,7 @@ class BaseSequenceGenerator:
                 self.meta_arg_2 = ''.join(value_list[1])
                 self.meta_arg_3 = ''.join(value_list[2])
                 self.meta_arg_4 = ''.join(value_list[3])
-        elif file_to_create == PATH_JSON:
+        elif file_to_create == self.file_paths.get('json'):
             self.meta_arg_1 = self.loaded_data.get('meta').get(first_arg)
             self.meta_arg_2 = self.loaded_data.get('meta').get(second_arg)
             self.meta_arg_3 = self.loaded_data.get('meta').get(third_arg)
@@ -285,19 +1289,401 @@ class BaseSequenceGenerator:
         ):
             return True
 
-    def _generate_sequence(self, file_type):
+    def _header_meta(self):
+        return {
+            'generator_name': self.generator_name,
+            'seq_type': self.seq_type,
+            'seq_len': str(self.len),
+            'el_type': type(self.element_type).__name__,
+            'author': self.__class__.__name__,
+            'min_element': str(self.min),
+            'max_element': str(self.max)
+        }
+
+    def _header_differs(self, header_meta, *keys):
+        meta = self._header_meta()
+        return any(header_meta.get(key) != meta[key] for key in keys)
+
+    def _write_header(self, file_path):
+        with self._phase('header'):
+            file_stat = os.stat(file_path)
+            header = {
+                'meta': self._header_meta(),
+                'size': file_stat.st_size,
+                'mtime_ns': file_stat.st_mtime_ns,
+                'hash': _file_hash(file_path),
+                'spec': self.generation_spec and self.generation_spec[:-2]
+            }
+            with _atomic_write(file_path + HEADER_SUFFIX) as header_file:
+                json.dump(header, header_file)
+            self._cache_artifact(header)
+
+    def _cache_artifact(self, header):
+        if self.generation_spec is not None:
+            GENERATION_CACHE.put_artifact(
+                self.generation_spec, (header['hash'], self.len)
+            )
+
+    def _cached_artifact(self, file_type, spec):
+        file_to_create, files_to_delete = self._file_paths(file_type)
+        self.generator_name = spec[0]
+        self.generation_spec = spec + (self.seq_type, file_to_create)
+        if self.bundle is not None:
+            return False
+        artifact = GENERATION_CACHE.get_artifact(self.generation_spec)
+        header = artifact and _stored_header(file_to_create)
+        if not header or header['hash'] != artifact[0]:
+            GENERATION_CACHE.artifact_misses += 1
+            self._emit_cache('artifact', False)
+            return False
+        if self.max_sequence < artifact[1]:
+            raise InvalidSequenceLen(
+                'Sequence length is greater than a given value'
+            )
+        GENERATION_CACHE.artifact_hits += 1
+        self._emit_cache('artifact', True)
+        _remove_files(*files_to_delete)
+        return True
+
+    def _generate_payload(self, spec, elements):
+        if self.memory_budget is not None:
+            with self._phase('generate'):
+                sequence = tuple(elements)
+            self.len = len(sequence)
+            return sequence
+        payload = GENERATION_CACHE.get_payload(spec)
+        self._emit_cache('payload', payload is not None)
+        if payload is None:
+            with self._phase('generate'):
+                sequence = tuple(elements)
+            payload = (sequence, self.min, self.max, len(sequence))
+            GENERATION_CACHE.put_payload(spec, payload)
+        sequence, self.min, self.max, self.len = payload
+        return sequence
+
+    def _file_paths(self, file_type):
+        if isinstance(file_type, str) and file_type in self.file_paths:
+            return self.file_paths[file_type], tuple(
+                path for path in self.file_paths.values()
+                if path != self.file_paths[file_type]
+            )
+        raise InvalidFileTypeArgument(
+            'File type argument should be Json, XML, Bin, Gzip, Bz2, Lzma'
+            ' or Range'
+        )
+
+    def _serialise_bin_data(self, file, elements):
+        seq_len = escape_len = 0
+        chunk = array('q')
+        file.write(bytes(BIN_DATA_OFFSET))
+        with tempfile.TemporaryFile() as escapes:
+            for element in elements:
+                if BIN_ESCAPE < element < -BIN_ESCAPE:
+                    chunk.append(element)
+                else:
+                    chunk.append(BIN_ESCAPE)
+                    data = element.to_bytes(
+                        element.bit_length() // 8 + 1, 'little', signed=True
+                    )
+                    escapes.write(BIN_ESCAPE_LEN.pack(len(data)) + data)
+                    escape_len += 1
+                seq_len += 1
+                if len(chunk) == CHUNK_SIZE:
+                    chunk.tofile(file)
+                    chunk = array('q')
+            chunk.tofile(file)
+            escapes.seek(0)
+            shutil.copyfileobj(escapes, file)
+        meta_offset = file.tell()
+        meta = json.dumps(self._meta_to_write(file.name)).encode()
+        file.write(meta)
+        file.seek(0)
+        file.write(BIN_HEADER.pack(
+            BIN_MAGIC, BIN_VERSION, sys.byteorder[0].encode(), seq_len,
+            escape_len, meta_offset, len(meta)
+        ))
+
+    @staticmethod
+    def _varint(value):
+        data = bytearray()
+        while value > 0x7f:
+            data.append(value & 0x7f | 0x80)
+            value >>= 7
+        data.append(value)
+        return data
+
+    def _serialise_packed_data(self, file, file_path, codec_name, elements):
+        previous = 0
+        chunk = bytearray()
+        chunk_len = 0
+        file.write(PACKED_MAGIC)
+        for element in elements:
+            delta = element - previous
+            previous = element
+            chunk += self._varint(delta * 2 if delta >= 0 else -delta * 2 - 1)
+            chunk_len += 1
+            if chunk_len == CHUNK_SIZE:
+                file.write(self._varint(chunk_len) + chunk)
+                chunk = bytearray()
+                chunk_len = 0
+        if chunk_len:
+            file.write(self._varint(chunk_len) + chunk)
+        file.write(self._varint(0))
+        meta = self._meta_to_write(file_path)
+        meta['codec'] = codec_name
+        meta['encoding'] = PACKED_ENCODING
+        file.write(json.dumps(meta).encode())
+
+    def _write_binary_file(self, file_type, elements):
+        with _atomic_write(self.file_paths[file_type], 'wb') as raw_file:
+            if file_type == 'bin':
+                self._serialise_bin_data(raw_file, elements)
+            else:
+                codec_name, codec = CODECS[file_type]
+                with codec.open(raw_file, 'wb') as file:
+                    self._serialise_packed_data(
+                        file, raw_file.name, codec_name, elements
+                    )
+
+    def _extension(self, header, spec):
+        stored_spec = header.get('spec')
+        if not isinstance(stored_spec, list) or self._header_differs(
+                header['meta'], 'generator_name', 'seq_type', 'el_type',
+                'author'
+        ):
+            return None
+        if spec[0] == 'range_generator':
+            start, end, step = spec[1:]
+            if stored_spec[:2] != [spec[0], start] or (
+                stored_spec[3:] != [step]
+            ):
+                return None
+            stored_len = len(range(start, stored_spec[2], step))
+            seq_len = len(range(start, end, step))
+            elements = range(start + stored_len * step, end, step)
+        elif self.seq_type != 'dict':
+            fibonacci_pair, seq_len = spec[1:]
+            if stored_spec[:2] != [spec[0], list(fibonacci_pair)]:
+                return None
+            stored_len = stored_spec[2]
+            elements = self.fibonacci_window(
+                fibonacci_pair, stored_len, max(stored_len, seq_len)
+            )
+        else:
+            return None
+        if not 0 < stored_len < seq_len <= self.max_sequence or (
+            header['meta']['seq_len'] != str(stored_len)
+        ):
+            return None
+        if spec[0] == 'range_generator':
+            self._check_memory_budget(seq_len - stored_len, max(
+                abs(start).bit_length(), abs(end).bit_length()
+            ))
+        else:
+            self._check_fibonacci_budget(fibonacci_pair, seq_len)
+        return stored_len, tuple(elements)
+
+    def _append_text_data(self, file_type, file_path, elements):
+        is_dict = self.seq_type == 'dict'
         if file_type == 'json':
-            file_to_create = PATH_JSON
-            file_to_delete = PATH_XML
-        elif file_type == 'xml':
-            file_to_create = PATH_XML
-            file_to_delete = PATH_JSON
+            template = JSON_TEMPLATES[is_dict]
+            separator = ',\n'
+            closing = '\n  ' + ('}' if is_dict else ']')
+            marker = closing + ',\n  "meta": '
         else:
-            raise InvalidFileTypeArgument(
-                'File type argument should be Json or XML'
+            template = XML_TEMPLATES[is_dict]
+            separator = '\n'
+            closing = '\n    </sequence>'
+            marker = closing + '\n    <meta>'
+        with open(file_path, 'r+b') as file:
+            with mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mapped:
+                position = mapped.rfind(marker.encode())
+            if position < 0:
+                return None
+            if file_type == 'json':
+                tail = closing + self._json_meta_text(file_path)
+            else:
+                tail = '\n'.join(
+                    [closing] + self._xml_meta_lines(file_path)
+                )
+            return self._rewrite_tail(file, position, (
+                separator + separator.join(
+                    template.format(element) for element in elements
+                ) + tail
+            ).encode())
+
+    @staticmethod
+    def _rewrite_tail(file, position, data):
+        file.seek(position)
+        stored_tail = file.read()
+        file.seek(position)
+        try:
+            file.write(data)
+            file.truncate()
+            file.flush()
+            os.fsync(file.fileno())
+        except BaseException:
+            file.seek(position)
+            file.write(stored_tail)
+            file.truncate()
+            file.flush()
+            raise
+        return len(data)
+
+    def _append_bin_data(self, file_path, stored_len, elements):
+        if not all(BIN_ESCAPE < element < -BIN_ESCAPE for element in elements):
+            return None
+        with open(file_path, 'r+b') as file:
+            (
+                magic, version, byteorder, seq_len, escape_len,
+                meta_offset, meta_len
+            ) = BIN_HEADER.unpack(file.read(BIN_HEADER.size))
+            if (magic, version, byteorder, seq_len, escape_len) != (
+                BIN_MAGIC, BIN_VERSION, sys.byteorder[0].encode(),
+                stored_len, 0
+            ) or meta_offset != BIN_DATA_OFFSET + seq_len * 8:
+                return None
+            data = array('q', elements).tobytes()
+            meta = json.dumps(self._meta_to_write(file_path)).encode()
+            written = self._rewrite_tail(file, meta_offset, data + meta)
+            file.seek(0)
+            file.write(BIN_HEADER.pack(
+                BIN_MAGIC, BIN_VERSION, sys.byteorder[0].encode(),
+                self.len, 0, meta_offset + len(data), len(meta)
+            ))
+        return written + BIN_HEADER.size
+
+    def _extend_sequence(self, file_type, spec):
+        if self.bundle is not None or not self.incremental or (
+            file_type not in APPENDABLE_TYPES
+        ):
+            return False
+        file_to_create, files_to_delete = self._file_paths(file_type)
+        header = _stored_header(file_to_create)
+        extension = header and self._extension(header, spec)
+        if not extension:
+            return False
+        stored_len, elements = extension
+        self.sequence = None
+        self.len = stored_len + len(elements)
+        self.min = min(int(header['meta']['min_element']), *elements)
+        self.max = max(int(header['meta']['max_element']), *elements)
+        if self.seq_type == 'dict':
+            self.min = str(self.min)
+            self.max = str(self.max)
+        with self._phase('append', file_type=file_type) as phase:
+            if file_type == 'bin':
+                written = self._append_bin_data(
+                    file_to_create, stored_len, elements
+                )
+            else:
+                written = self._append_text_data(
+                    file_type, file_to_create, elements
+                )
+            if phase is not None:
+                phase['bytes_written'] = written or 0
+        if written is None:
+            return False
+        _remove_files(*files_to_delete)
+        self._write_header(file_to_create)
+        return True
+
+    def _store_range(self, file_type, start, end, step):
+        file_to_create, files_to_delete = self._file_paths(file_type)
+        indices = range(start, end, step)
+        if self.max_sequence < len(indices):
+            raise InvalidSequenceLen(
+                'Sequence length is greater than a given value'
+            )
+        self.sequence = None
+        self.len = len(indices)
+        self.min = indices[0]
+        self.max = indices[-1]
+        if self.seq_type == 'dict':
+            self.min = str(self.min)
+            self.max = str(self.max)
+        _remove_files(*files_to_delete)
+        header = _stored_header(file_to_create)
+        if header is not None and not self._header_differs(
+                header['meta'], *header['meta']
+        ):
+            return self._cache_artifact(header)
+        with self._phase('serialise', file_type=file_type) as phase:
+            with _atomic_write(file_to_create) as file:
+                json.dump({
+                    'parameters': {'start': start, 'end': end, 'step': step},
+                    'meta': self._meta_to_write(file.name)
+                }, file, indent=2)
+            if phase is not None:
+                phase['bytes_written'] = os.path.getsize(file_to_create)
+        self._write_header(file_to_create)
+
+    def _valid_workers(self, file_type, workers):
+        if not isinstance(workers, int) or isinstance(workers, bool):
+            raise IncorrectArgumentTypeError(
+                'Incorrect generator argument type'
+            )
+        if workers < 1:
+            raise InvalidArgumentValueError('Invalid generator argument value')
+        if workers > 1 and (
+                file_type not in PARALLEL_TYPES or self.bundle is not None
+        ):
+            raise InvalidArgumentValueError(
+                'Parallel workers support only json and xml files'
+            )
+
+    def _stream_sequence(
+            self, file_type, elements, seq_len, spec=None, workers=1
+    ):
+        file_to_create, files_to_delete = self._file_paths(file_type)
+        self._valid_workers(file_type, workers)
+        if self.max_sequence < seq_len:
+            raise InvalidSequenceLen(
+                'Sequence length is greater than a given value'
             )
-        if os.path.isfile(file_to_delete):
-            os.remove(file_to_delete)
+        if self.bundle is not None:
+            self.sequence = None
+            return self.bundle._write_stream_entry(self, elements)
+        self.sequence = None
+        _remove_files(*files_to_delete)
+        with self._phase(
+                'serialise', file_type=file_type, stream=True
+        ) as phase:
+            if file_type in BINARY_TYPES:
+                self._write_binary_file(
+                    file_type, self._tracked_elements(elements)
+                )
+            elif workers > 1 and seq_len > 0:
+                with _atomic_write(file_to_create) as file:
+                    self._serialise_parallel_data(
+                        file, file_type, spec, seq_len, workers
+                    )
+            else:
+                with _atomic_write(file_to_create) as file:
+                    if file_type == 'json':
+                        self._stream_json_data(file, elements)
+                    else:
+                        self._serialise_xml_data(
+                            file, self._tracked_elements(elements)
+                        )
+            if phase is not None:
+                phase['bytes_written'] = os.path.getsize(file_to_create)
+        self._write_header(file_to_create)
+
+    def _generate_sequence(self, file_type):
+        try:
+            if self.bundle is not None:
+                return self.bundle._write_entry(self)
+            return self._write_sequence(file_type)
+        finally:
+            if self.memory_budget is not None:
+                self._release_buffers()
+
+    def _write_sequence(self, file_type):
+        file_to_create, files_to_delete = self._file_paths(file_type)
+        _remove_files(*files_to_delete)
         if os.path.isfile(file_to_create) and os.path.getsize(
                 file_to_create
         ) > 0:
@@ -308,57 +1694,233 @@ class BaseSequenceGenerator:
             raise InvalidSequenceLen(
                 'Sequence length is greater than a given value'
             )
-        with open(file_to_create, file_mode) as file:
-            if file_mode == 'r+':
-                if not self._valid_file(file_to_create, file):
-                    self._write_data(file_to_create, file)
-                else:
-                    if self._is_need_to_generate_new_info(
+        header = _stored_header(file_to_create)
+        if header is not None:
+            if not self._header_differs(
+                    header['meta'], 'seq_type', 'author',
+                    'min_element', 'max_element'
+            ):
+                return self._cache_artifact(header)
+            if self._header_differs(
+                    header['meta'], 'generator_name',
+                    'seq_len', 'min_element', 'max_element'
+            ):
+                file_mode = 'w'
+        if file_type in BINARY_TYPES:
+            with self._phase('serialise', file_type=file_type) as phase:
+                self._write_binary_file(file_type, (
+                    self.sequence.values()
+                    if isinstance(self.sequence, Mapping) else self.sequence
+                ))
+                if phase is not None:
+                    phase['bytes_written'] = os.path.getsize(file_to_create)
+            return self._write_header(file_to_create)
+        write_file = self._write_data
+        if file_mode == 'r+':
+            with self._phase('validate', file_type=file_type) as phase:
+                with open(file_to_create, 'rb') as file:
+                    valid_file = self._valid_file(file_to_create, file)
+                if phase is not None:
+                    phase['bytes_read'] = os.path.getsize(file_to_create)
+            if valid_file:
+                with self._phase('compare_meta', file_type=file_type):
+                    if not self._is_need_to_generate_new_info(
                             file_to_create, 'seq_type', 'author',
                             'min_element', 'max_element'
                     ):
-                        if not self._is_need_to_generate_new_info(
-                                file_to_create, 'generator_name',
-                                'seq_len', 'min_element', 'max_element'
-                        ):
-                            self._overwrite_metadata_only(file_to_create, file)
-                        else:
-                            self._write_data(file_to_create, file)
-                    else:
-                        pass
-            else:
-                self._write_data(file_to_create, file)
-
-    def __get_sequence_from_xml(self):
-        meta_info = self.loaded_data.findall('meta')
-        path_tuple = ('generator_name', 'seq_type')
-        value_list = []
-        for info in meta_info:
-            for path in path_tuple:
-                meta_keys = info.findall(path)
-                for val in meta_keys:
-                    value_list.append(val.text)
-
-        if len(value_list) != 2:
+                        write_file = None
+                    elif not self._is_need_to_generate_new_info(
+                            file_to_create, 'generator_name',
+                            'seq_len', 'min_element', 'max_element'
+                    ):
+                        write_file = self._overwrite_metadata_only
+        if write_file is not None:
+            with self._phase('serialise', file_type=file_type) as phase:
+                with _atomic_write(file_to_create) as file:
+                    write_file(file_to_create, file)
+                if phase is not None:
+                    phase['bytes_written'] = os.path.getsize(file_to_create)
+        self._write_header(file_to_create)
+
+    def __get_sequence_from_xml(self, file):
+        meta = {}
+        sequence = []
+        sequence_element = None
+        in_meta = False
+        backend = SERIALISERS.get('xml')
+        try:
+            for event, element in backend.iterparse(file, ('start', 'end')):
+                if event == 'start':
+                    if element.tag == 'sequence':
+                        sequence_element = element
+                    elif element.tag == 'meta':
+                        in_meta = True
+                elif element.tag == 'elem' and sequence_element is not None:
+                    if len(sequence) <= self.max_sequence:
+                        sequence.append(int(element.text))
+                        if len(sequence) % CHUNK_SIZE == 0:
+                            self._check_memory_budget(len(sequence))
+                    sequence_element.clear()
+                elif element.tag == 'meta':
+                    in_meta = False
+                elif in_meta:
+                    meta[element.tag] = element.text
+                    element.clear()
+        except (ValueError, TypeError, *backend.errors):
             raise InvalidXML('Invalid xml file')
-        self.generator_name = ''.join(value_list[0])
-        self.seq_type = ''.join(value_list[1])
-        sequence = self.loaded_data.findall('sequence')
-        self.seq_from_file = []
-        for element in sequence:
-            seq_elem = element.findall('elem')
-            for i in seq_elem:
-                self.seq_from_file.append(i.text)
+        if not (
+            meta.get('generator_name') and meta.get('seq_type')
+        ) or meta['seq_type'] not in ('list', 'tuple', 'set', 'dict'):
+            raise InvalidXML('Invalid xml file')
+        self.generator_name = meta['generator_name']
+        self.seq_type = meta['seq_type']
+        if len(sequence) > self.max_sequence:
+            self._valid_seq_type()
+            raise InvalidSequenceLen(
+                'Sequence length is greater than a given value'
+            )
         if self.seq_type == 'dict':
-            self.seq_from_file = {
-                    str(i): i for i in list(map(int, self.seq_from_file))
-            }
-        elif self.seq_type in ('list', 'tuple', 'set'):
-            self.seq_from_file = list(map(int, self.seq_from_file))
+            self.seq_from_file = self._dict_sequence(sequence)
         else:
-            raise InvalidXML('Invalid xml file')
+            self.seq_from_file = sequence
         return self.seq_from_file
 
+    def __get_sequence_from_bin(self, zero_copy):
+        with open(self.file_paths['bin'], 'rb') as file:
+            try:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise InvalidBinary('Invalid binary file')
+        try:
+            (
+                magic, version, byteorder, seq_len, escape_len,
+                meta_offset, meta_len
+            ) = BIN_HEADER.unpack_from(mapped)
+            meta = json.loads(mapped[meta_offset:meta_offset + meta_len])
+            self.generator_name = meta['generator_name']
+            self.seq_type = meta['seq_type']
+        except (ValueError, TypeError, KeyError, struct.error):
+            mapped.close()
+            raise InvalidBinary('Invalid binary file')
+        if (magic, version, byteorder) != (
+            BIN_MAGIC, BIN_VERSION, sys.byteorder[0].encode()
+        ) or meta_offset < BIN_DATA_OFFSET + seq_len * 8 or (
+            meta_offset + meta_len > len(mapped)
+        ):
+            mapped.close()
+            raise InvalidBinary('Invalid binary file')
+        try:
+            self._valid_seq_type()
+            if self.max_sequence < seq_len:
+                raise InvalidSequenceLen(
+                    'Sequence length is greater than a given value'
+                )
+            if not zero_copy or escape_len or self.seq_type == 'dict':
+                self._check_memory_budget(seq_len)
+        except Exception:
+            mapped.close()
+            raise
+        view = memoryview(mapped)[
+            BIN_DATA_OFFSET:BIN_DATA_OFFSET + seq_len * 8
+        ].cast('q')
+        if zero_copy and not escape_len and self.seq_type != 'dict':
+            return view
+        sequence = view.tolist()
+        view.release()
+        try:
+            if escape_len:
+                self.__decode_bin_escapes(
+                    mapped, sequence, BIN_DATA_OFFSET + seq_len * 8,
+                    meta_offset
+                )
+        finally:
+            mapped.close()
+        if self.seq_type == 'dict':
+            return self._dict_sequence(sequence)
+        return sequence
+
+    @staticmethod
+    def __decode_bin_escapes(mapped, sequence, offset, meta_offset):
+        for index, element in enumerate(sequence):
+            if element != BIN_ESCAPE:
+                continue
+            if offset + BIN_ESCAPE_LEN.size > meta_offset:
+                raise InvalidBinary('Invalid binary file')
+            data_len = BIN_ESCAPE_LEN.unpack_from(mapped, offset)[0]
+            offset += BIN_ESCAPE_LEN.size
+            if offset + data_len > meta_offset:
+                raise InvalidBinary('Invalid binary file')
+            sequence[index] = int.from_bytes(
+                mapped[offset:offset + data_len], 'little', signed=True
+            )
+            offset += data_len
+
+    def __get_sequence_from_packed(self, file_type):
+        codec_name, codec = CODECS[file_type]
+        sequence = []
+        seq_len = previous = 0
+        try:
+            with codec.open(self.file_paths[file_type], 'rb') as file:
+                stream = VarintStream(file)
+                if stream.read_bytes(len(PACKED_MAGIC)) != PACKED_MAGIC:
+                    raise InvalidBinary('Invalid binary file')
+                chunk_len, = stream.read_varints(1)
+                while chunk_len:
+                    zigzags = stream.read_varints(chunk_len)
+                    seq_len += chunk_len
+                    self._check_memory_budget(seq_len)
+                    if seq_len <= self.max_sequence:
+                        sequence.extend(islice(accumulate(
+                            (zigzag >> 1 ^ -(zigzag & 1)
+                             for zigzag in zigzags),
+                            initial=previous
+                        ), 1, None))
+                        previous = sequence[-1]
+                    chunk_len, = stream.read_varints(1)
+                meta = json.loads(stream.read_rest())
+            self.generator_name = meta['generator_name']
+            self.seq_type = meta['seq_type']
+        except (OSError, EOFError, ValueError, TypeError, KeyError,
+                IndexError, lzma.LZMAError):
+            raise InvalidBinary('Invalid binary file')
+        if meta.get('codec') != codec_name or (
+            meta.get('encoding') != PACKED_ENCODING
+        ):
+            raise InvalidBinary('Invalid binary file')
+        if seq_len > self.max_sequence:
+            self._valid_seq_type()
+            raise InvalidSequenceLen(
+                'Sequence length is greater than a given value'
+            )
+        if self.seq_type == 'dict':
+            return self._dict_sequence(sequence)
+        return sequence
+
+    def __get_sequence_from_range(self):
+        try:
+            with open(self.file_paths['range'], 'r') as file:
+                loaded_data = json.load(file)
+            self.generator_name = loaded_data['meta']['generator_name']
+            self.seq_type = loaded_data['meta']['seq_type']
+            indices = range(
+                loaded_data['parameters']['start'],
+                loaded_data['parameters']['end'],
+                loaded_data['parameters']['step']
+            )
+        except (ValueError, TypeError, KeyError):
+            raise InvalidJson('Invalid json file')
+        return RANGE_VIEWS[self.appropriate_seq_type](indices)
+
+    def _check_json_budget(self, file):
+        if self.memory_budget is not None:
+            file.seek(max(
+                os.fstat(file.fileno()).st_size - META_TAIL_SIZE, 0
+            ))
+            seq_len = SEQ_LEN_PATTERN.search(file.read())
+            file.seek(0)
+            if seq_len:
+                self._check_memory_budget(int(seq_len.group(1)))
+
     def __get_sequence_from_json(self):
         self.seq_type = self.loaded_data.get('meta').get('seq_type')
         self.generator_name = self.loaded_data.get('meta').get(
@@ -367,49 +1929,118 @@ class BaseSequenceGenerator:
         if self.seq_type is None:
             raise InvalidJson('Invalid json file')
         self.seq_from_file = self.loaded_data.get('sequence')
+        self._check_memory_budget(len(self.seq_from_file or ()))
+        if self.seq_type == 'dict' and isinstance(self.seq_from_file, dict):
+            try:
+                sequence = CompactDictView(self.seq_from_file.values())
+            except (TypeError, OverflowError):
+                return self.seq_from_file
+            if list(sequence) == list(self.seq_from_file):
+                self.seq_from_file = sequence
         return self.seq_from_file
 
-    def _get_sequence(self):
-        if os.path.isfile(PATH_XML) and not os.path.isfile(PATH_JSON):
-            file_path = PATH_XML
-        elif os.path.isfile(PATH_JSON) and not os.path.isfile(PATH_XML):
-            file_path = PATH_JSON
+    @staticmethod
+    def _dict_sequence(elements):
+        try:
+            return CompactDictView(elements)
+        except OverflowError:
+            return {str(i): i for i in elements}
+
+    def _valid_seq_type(self):
+        if (
+            self.seq_type == 'dict' and self.appropriate_seq_type != 'dict'
+        ) or (
+            self.seq_type != 'dict' and self.appropriate_seq_type == 'dict'
+        ):
+            raise BadSeqType('Invalid seq type')
+
+    def _get_sequence(self, zero_copy=False):
+        if self.bundle is not None:
+            file_type, file_path = 'bundle', self.bundle.path
         else:
-            if self.appropriate_seq_type == 'dict':
-                return {}
-            else:
-                return []
-        with open(file_path, 'r') as file:
-            if not self._valid_file(file_path, file):
-                raise (InvalidXML(
-                    'Invalid xml file'
-                ) if file_path == PATH_XML else InvalidJson(
-                    'Invalid json file')
-                       )
-            if file_path == PATH_XML:
-                self.seq_from_file = self.__get_sequence_from_xml()
-            elif file_path == PATH_JSON:
-                self.seq_from_file = self.__get_sequence_from_json()
-            if (
-                self.seq_type == 'dict' and self.appropriate_seq_type != 'dict'
-            ) or (
-                self.seq_type != 'dict' and self.appropriate_seq_type == 'dict'
-            ):
-                raise BadSeqType('Invalid seq type')
-            if self.max_sequence < len(self.seq_from_file):
-                raise InvalidSequenceLen(
-                    'Sequence length is greater than a given value'
-                )
-            if (
-                self.__class__.__name__ in (
-                    'DictSequenceGenerator', 'SetSequenceGenerator'
-                ) and self.generator_name == 'fibonacci_generator'
-            ):
-                raise InappropriateTypeForFiboGeneration(
-                    'The sequence with given arguments'
-                    ' will not be a fibonacci sequence'
+            stored_files = [
+                (file_type, path)
+                for file_type, path in self.file_paths.items()
+                if os.path.isfile(path)
+            ]
+            if len(stored_files) != 1:
+                if self.appropriate_seq_type == 'dict':
+                    return {}
+                else:
+                    return []
+            file_type, file_path = stored_files[0]
+        file_key = None
+        if self.memory_budget is not None and file_type not in (
+                'range', 'bundle'
+        ):
+            header = _stored_header(file_path)
+            if header is not None:
+                self._check_memory_budget(
+                    int(header['meta']['seq_len']), max(
+                        abs(int(header['meta'][key])).bit_length()
+                        for key in ('min_element', 'max_element')
+                    )
                 )
-        return self.seq_from_file
+        elif file_type not in ('range', 'bundle') and not (
+            zero_copy and file_type == 'bin'
+        ):
+            file_key = ReadCache.file_key(file_path)
+        cached = file_key and READ_CACHE.get(file_key)
+        if file_key:
+            self._emit_cache('read', bool(cached))
+        with self._phase('parse', file_type=file_type) as phase:
+            if cached:
+                self.seq_type, self.generator_name, self.seq_from_file = cached
+            elif file_type == 'bin':
+                self.seq_from_file = self.__get_sequence_from_bin(zero_copy)
+            elif file_type in CODECS:
+                self.seq_from_file = self.__get_sequence_from_packed(file_type)
+            elif file_type == 'range':
+                self.seq_from_file = self.__get_sequence_from_range()
+            elif file_type == 'bundle':
+                self.loaded_data = self.bundle.entry
+                self.seq_from_file = self.__get_sequence_from_json()
+                if isinstance(self.seq_from_file, list):
+                    self.seq_from_file = tuple(self.seq_from_file)
+            else:
+                with open(file_path, 'rb') as file:
+                    if file_type == 'xml':
+                        self.seq_from_file = self.__get_sequence_from_xml(file)
+                    else:
+                        self._check_json_budget(file)
+                        if not self._valid_file(file_path, file):
+                            raise InvalidJson('Invalid json file')
+                        self.seq_from_file = self.__get_sequence_from_json()
+                        if self.memory_budget is not None:
+                            self.loaded_data = None
+            if phase is not None:
+                phase['bytes_read'] = 0 if cached or (
+                    file_type == 'bundle'
+                ) else os.path.getsize(file_path)
+        if file_key and not cached:
+            if isinstance(self.seq_from_file, list):
+                self.seq_from_file = tuple(self.seq_from_file)
+            READ_CACHE.put(file_key, (
+                self.seq_type, self.generator_name, self.seq_from_file
+            ))
+        self._valid_seq_type()
+        if self.max_sequence < len(self.seq_from_file):
+            raise InvalidSequenceLen(
+                'Sequence length is greater than a given value'
+            )
+        if (
+            self.__class__.__name__ in (
+                'DictSequenceGenerator', 'SetSequenceGenerator'
+            ) and self.generator_name == 'fibonacci_generator'
+        ):
+            raise InappropriateTypeForFiboGeneration(
+                'The sequence with given arguments'
+                ' will not be a fibonacci sequence'
+            )
+        sequence = self.seq_from_file
+        if self.memory_budget is not None:
+            self._release_buffers()
+        return sequence
 
     def _additional_range_generator(self, start, end, step=1):
         if not self._invalid_args(start, end, step, generator_type='range'):
@@ -422,58 +2053,179 @@ class BaseSequenceGenerator:
                 num += step
                 self.len += 1
 
+    def _locked_call(self, method, *args, **kwargs):
+        locks = [_file_lock(path) for path in sorted({
+            os.path.abspath(path) for path in self.file_paths.values()
+        })]
+        for lock in locks:
+            lock.acquire()
+        try:
+            return getattr(self, method)(*args, **kwargs)
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    async def _run_in_executor(self, executor, method, *args, **kwargs):
+        import asyncio
+        from concurrent.futures import ProcessPoolExecutor
+
+        if isinstance(executor, ProcessPoolExecutor):
+            raise IncorrectArgumentTypeError(
+                'Incorrect generator argument type'
+            )
+        async with _async_semaphore():
+            return await asyncio.get_running_loop().run_in_executor(
+                executor, partial(self._locked_call, method, *args, **kwargs)
+            )
+
+    async def agenerate_range_sequence(self, *args, executor=None, **kwargs):
+        return await self._run_in_executor(
+            executor, 'generate_range_sequence', *args, **kwargs
+        )
+
+    async def agenerate_fibonacci_sequence(
+            self, *args, executor=None, **kwargs
+    ):
+        return await self._run_in_executor(
+            executor, 'generate_fibonacci_sequence', *args, **kwargs
+        )
+
+    async def aget_sequence(self, *args, executor=None, **kwargs):
+        return await self._run_in_executor(
+            executor, 'get_sequence', *args, **kwargs
+        )
+
     def __repr__(self):
         return f'{self.__class__.__name__}({self.max_sequence})'
 
 
+def _serialise_shard(shard):
+    spec, start, end, template, separator = shard
+    if spec[0] == 'range_generator':
+        first, _, step = spec[1:]
+        elements = range(first + start * step, first + end * step, step)
+    else:
+        elements = BaseSequenceGenerator.fibonacci_window(spec[1], start, end)
+    lines = []
+    min_element = max_element = None
+    for element in elements:
+        if not lines:
+            min_element = max_element = element
+        else:
+            min_element = min(min_element, element)
+            max_element = max(max_element, element)
+        lines.append(template.format(element))
+    return separator.join(lines), len(lines), min_element, max_element
+
+
 class ListSequenceGenerator(BaseSequenceGenerator):
     __slots__ = ()
 
-    def generate_range_sequence(self, file_type, start, end, step=1):
-        self.sequence = [
-            i for i in self._additional_range_generator(start, end, step)
-        ]
+    def generate_range_sequence(
+            self, file_type, start, end, step=1, stream=False, workers=1
+    ):
         self.element_type = start
+        self._invalid_args(start, end, step, generator_type='range')
+        spec = ('range_generator', start, end, step)
+        if self._cached_artifact(file_type, spec) or self._extend_sequence(
+                file_type, spec
+        ):
+            return None
+        if file_type == 'range':
+            return self._store_range(file_type, start, end, step)
+        if stream or workers != 1 or self.memory_budget is not None:
+            return self._stream_sequence(
+                file_type,
+                self._additional_range_generator(start, end, step),
+                len(range(start, end, step)), spec, workers
+            )
+        self.sequence = self._generate_payload(
+            spec, self._additional_range_generator(start, end, step)
+        )
         return self._generate_sequence(file_type)
 
-    def generate_fibonacci_sequence(self, file_type, fibonacci_pair, fib_len):
-        self.sequence = [
-            i for i in self._fibonacci_generator(fibonacci_pair, fib_len)
-        ]
-        self.len = fib_len
+    def generate_fibonacci_sequence(
+            self, file_type, fibonacci_pair, fib_len, stream=False,
+            workers=1
+    ):
+        self._invalid_fibonacci_pair(fibonacci_pair)
+        self._invalid_args(fib_len, generator_type='fibonacci')
+        self.element_type = fibonacci_pair[0]
+        if file_type == 'range':
+            raise InvalidFileTypeArgument(
+                'File type argument should be Json, XML, Bin, Gzip, Bz2, Lzma'
+                ' or Range'
+            )
+        spec = ('fibonacci_generator', fibonacci_pair, fib_len)
+        if self._cached_artifact(file_type, spec) or self._extend_sequence(
+                file_type, spec
+        ):
+            return None
+        if (
+            stream or workers != 1 or self.memory_budget is not None
+        ) and self.seq_type in ('list', 'tuple'):
+            return self._stream_sequence(
+                file_type,
+                self._fibonacci_generator(fibonacci_pair, fib_len),
+                fib_len, spec, workers
+            )
+        self._check_fibonacci_budget(fibonacci_pair, fib_len)
+        self.sequence = self._generate_payload(
+            spec, self._fibonacci_generator(fibonacci_pair, fib_len)
+        )
         return self._generate_sequence(file_type)
 
-    def get_sequence(self):
+    def get_sequence(self, zero_copy=False):
         self.appropriate_seq_type = 'list'
-        return self._get_sequence()
+        sequence = self._get_sequence(zero_copy)
+        if isinstance(sequence, tuple):
+            return list(sequence)
+        return sequence
 
 
 class TupleSequenceGenerator(ListSequenceGenerator):
     __slots__ = ()
 
-    def generate_range_sequence(self, file_type, start, end, step=1):
+    def generate_range_sequence(
+            self, file_type, start, end, step=1, stream=False, workers=1
+    ):
         self.seq_type = 'tuple'
-        return super().generate_range_sequence(file_type, start, end, step)
+        return super().generate_range_sequence(
+            file_type, start, end, step, stream, workers
+        )
 
-    def generate_fibonacci_sequence(self, file_type, fibonacci_pair, fib_len):
+    def generate_fibonacci_sequence(
+            self, file_type, fibonacci_pair, fib_len, stream=False,
+            workers=1
+    ):
         self.seq_type = 'tuple'
         return super().generate_fibonacci_sequence(
-            file_type, fibonacci_pair, fib_len
+            file_type, fibonacci_pair, fib_len, stream, workers
         )
 
     def get_sequence(self):
         self.appropriate_seq_type = 'tuple'
-        return tuple(self._get_sequence())
+        sequence = self._get_sequence()
+        if isinstance(sequence, RangeTupleView):
+            return sequence
+        return tuple(sequence)
 
 
 class SetSequenceGenerator(ListSequenceGenerator):
     __slots__ = ()
 
-    def generate_range_sequence(self, file_type, start, end, step=1):
+    def generate_range_sequence(
+            self, file_type, start, end, step=1, stream=False, workers=1
+    ):
         self.seq_type = 'set'
-        return super().generate_range_sequence(file_type, start, end, step)
+        return super().generate_range_sequence(
+            file_type, start, end, step, stream, workers
+        )
 
-    def generate_fibonacci_sequence(self, file_type, fibonacci_pair, fib_len):
+    def generate_fibonacci_sequence(
+            self, file_type, fibonacci_pair, fib_len, stream=False,
+            workers=1
+    ):
         if fibonacci_pair[0] == fibonacci_pair[1]:
             raise InappropriateTypeForFiboGeneration(
                 'The sequence with given arguments'
@@ -481,79 +2233,548 @@ class SetSequenceGenerator(ListSequenceGenerator):
             )
         self.seq_type = 'set'
         return super().generate_fibonacci_sequence(
-            file_type, fibonacci_pair, fib_len
+            file_type, fibonacci_pair, fib_len, stream, workers
         )
 
     def get_sequence(self):
         self.appropriate_seq_type = 'set'
-        return set(self._get_sequence())
+        sequence = self._get_sequence()
+        if isinstance(sequence, RangeSetView):
+            return sequence
+        return set(sequence)
 
 
 class DictSequenceGenerator(BaseSequenceGenerator):
     __slots__ = ()
 
-    def generate_range_sequence(self, file_type, start, end, step=1):
-        self.sequence = {
-                z: z for z in self._additional_range_generator(start, end, step)
-            }
-        self.min = str(self.min)
-        self.max = str(self.max)
+    def generate_range_sequence(
+            self, file_type, start, end, step=1, stream=False, workers=1
+    ):
         self.element_type = {start: start}.values()
         self.seq_type = 'dict'
+        self._invalid_args(start, end, step, generator_type='range')
+        spec = ('range_generator', start, end, step)
+        if self._cached_artifact(file_type, spec) or self._extend_sequence(
+                file_type, spec
+        ):
+            return None
+        if file_type == 'range':
+            return self._store_range(file_type, start, end, step)
+        if stream or workers != 1 or self.memory_budget is not None:
+            return self._stream_sequence(
+                file_type,
+                self._additional_range_generator(start, end, step),
+                len(range(start, end, step)), spec, workers
+            )
+        self.sequence = self._dict_sequence(self._generate_payload(
+            spec, self._additional_range_generator(start, end, step)
+        ))
+        self.min = str(self.min)
+        self.max = str(self.max)
         return self._generate_sequence(file_type)
 
-    def generate_fibonacci_sequence(self, file_type, fibonacci_pair, fib_len):
+    def generate_fibonacci_sequence(
+            self, file_type, fibonacci_pair, fib_len, stream=False,
+            workers=1
+    ):
         if fibonacci_pair[0] == fibonacci_pair[1]:
             raise InappropriateTypeForFiboGeneration(
                 'The sequence with given arguments'
                 ' will not be a fibonacci sequence'
             )
-        self.sequence = {
-            z: z for z in self._fibonacci_generator(fibonacci_pair, fib_len)
-        }
+        self._invalid_fibonacci_pair(fibonacci_pair)
+        self._invalid_args(fib_len, generator_type='fibonacci')
         self.element_type = {fibonacci_pair[0]: fibonacci_pair[0]}.values()
-        self.min = str(fibonacci_pair[0])
-        self.max = str(self.max)
-        self.len = fib_len
         self.seq_type = 'dict'
+        if file_type == 'range':
+            raise InvalidFileTypeArgument(
+                'File type argument should be Json, XML, Bin, Gzip, Bz2, Lzma'
+                ' or Range'
+            )
+        spec = ('fibonacci_generator', fibonacci_pair, fib_len)
+        if self._cached_artifact(file_type, spec):
+            return None
+        self._check_fibonacci_budget(fibonacci_pair, fib_len)
+        self.sequence = self._dict_sequence(self._generate_payload(
+            spec, self._fibonacci_generator(fibonacci_pair, fib_len)
+        ))
+        self.min = str(self.min)
+        self.max = str(self.max)
         return self._generate_sequence(file_type)
 
-    def get_sequence(self):
+    def get_sequence(self, compact=False):
         self.appropriate_seq_type = 'dict'
-        return self._get_sequence()
+        sequence = self._get_sequence()
+        if isinstance(sequence, CompactDictView) and not compact:
+            return sequence.to_dict()
+        if isinstance(sequence, dict):
+            return dict(sequence)
+        return sequence
 
 
-def test_meta_data(*args):
-    test_generator_name = None
-    test_seq_type = None
-    test_seq_len = None
-    test_el_type = None
-    test_author = None
-    test_min_element = None
-    test_max_element = None
-    author = None
-    element_type = None
-    if len(args) == 5:
-        file_type, rand_start, rand_end, rand_step, seq_type = args
-        if file_type == 'xml':
-            with open(PATH_XML, 'r') as file:
-                loaded_data = ET.parse(file)
-                meta_info = loaded_data.findall('meta')
-                path_tuple = (
-                    'generator_name', 'seq_type', 'seq_len', 'el_type',
-                    'date_created', 'date_modified', 'author',
-                    'min_element', 'max_element'
-                )
-                value_list = []
-                for info in meta_info:
-                    for path in path_tuple:
-                        meta_keys = info.findall(path)
-                        for val in meta_keys:
-                            value_list.append(val.text)
-                assert len(value_list) == 9, 'invalid number of meta info'
-                test_generator_name = ''.join(value_list[0])
-                test_seq_type = ''.join(value_list[1])
-                test_seq_len = int(''.join(value_list[2]))
+class SequenceStore:
+    __slots__ = ('directory', 'index_path')
+
+    def __init__(self, directory):
+        if not isinstance(directory, str):
+            raise IncorrectArgumentTypeError(
+                'Incorrect generator argument type'
+            )
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.index_path = os.path.join(directory, STORE_INDEX)
+
+    @staticmethod
+    def _valid_name(name):
+        if not isinstance(name, str):
+            raise IncorrectArgumentTypeError(
+                'Incorrect generator argument type'
+            )
+        if not name or name.startswith('.') or os.sep in name or (
+            os.altsep and os.altsep in name
+        ):
+            raise InvalidArgumentValueError('Invalid generator argument value')
+
+    def _file_paths(self, name):
+        prefix = os.path.join(self.directory, name)
+        return {
+            file_type: prefix + os.path.splitext(path)[1]
+            for file_type, path in FILE_PATHS.items()
+        }
+
+    @contextmanager
+    def _locked(self, lock_name):
+        with open(
+                os.path.join(self.directory, lock_name + LOCK_SUFFIX), 'a'
+        ) as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            yield
+
+    @staticmethod
+    def _bound(generator, file_paths):
+        generator = copy.copy(generator)
+        generator.file_paths = file_paths
+        generator.incremental = False
+        return generator
+
+    def _update_index(self, name, entry):
+        with self._locked(STORE_INDEX):
+            index = self.index()
+            if entry is None:
+                index.pop(name, None)
+            else:
+                index[name] = entry
+            with _atomic_write(self.index_path) as file:
+                json.dump(index, file, indent=2)
+
+    def _entry(self, name):
+        self._valid_name(name)
+        entry = self.index().get(name)
+        if entry is None:
+            raise SequenceNotFound('Sequence with given name is not found')
+        return entry
+
+    def _generate(self, method, name, generator, file_type, *args, **kwargs):
+        self._valid_name(name)
+        file_paths = self._file_paths(name)
+        with self._locked(name):
+            getattr(self._bound(generator, {
+                key: path for key, path in file_paths.items()
+                if key == file_type
+            }), method)(file_type, *args, **kwargs)
+            header = _stored_header(file_paths[file_type])
+            self._update_index(name, {
+                'file_type': file_type,
+                'meta': header and header['meta']
+            })
+            _remove_files(*(
+                path for key, path in file_paths.items() if key != file_type
+            ))
+
+    def index(self):
+        try:
+            with open(self.index_path, 'r') as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+
+    def generate_range_sequence(self, name, generator, file_type, *args,
+                                **kwargs):
+        return self._generate(
+            'generate_range_sequence', name, generator, file_type,
+            *args, **kwargs
+        )
+
+    def generate_fibonacci_sequence(self, name, generator, file_type, *args,
+                                    **kwargs):
+        return self._generate(
+            'generate_fibonacci_sequence', name, generator, file_type,
+            *args, **kwargs
+        )
+
+    def get_sequence(self, name, generator, *args, **kwargs):
+        entry = self._entry(name)
+        while True:
+            file_path = self._file_paths(name)[entry['file_type']]
+            try:
+                if os.path.isfile(file_path):
+                    return self._bound(generator, {
+                        entry['file_type']: file_path
+                    }).get_sequence(*args, **kwargs)
+            except FileNotFoundError:
+                pass
+            latest_entry = self._entry(name)
+            if latest_entry == entry:
+                raise SequenceNotFound(
+                    'Sequence with given name is not found'
+                )
+            entry = latest_entry
+
+    def remove(self, name):
+        self._entry(name)
+        with self._locked(name):
+            self._update_index(name, None)
+            _remove_files(*self._file_paths(name).values())
+
+    def __contains__(self, name):
+        return name in self.index()
+
+    def __iter__(self):
+        return iter(self.index())
+
+    def __len__(self):
+        return len(self.index())
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.directory!r})'
+
+
+class SequenceBundle:
+    __slots__ = (
+        'path', 'date_stamp', 'file', 'name', 'count', 'entry', 'entries',
+        'entries_key', 'lock'
+    )
+
+    def __init__(self, path):
+        if not isinstance(path, str):
+            raise IncorrectArgumentTypeError(
+                'Incorrect generator argument type'
+            )
+        self.path = path
+        self.date_stamp = None
+        self.file = None
+        self.name = None
+        self.count = 0
+        self.entry = None
+        self.entries = None
+        self.entries_key = None
+        self.lock = threading.RLock()
+
+    @staticmethod
+    def _valid_spec(spec):
+        if not isinstance(spec, tuple) or len(spec) != 4:
+            raise IncorrectArgumentTypeError(
+                'Incorrect generator argument type'
+            )
+        name, generator, kind, args = spec
+        if not isinstance(name, str) or not isinstance(
+                generator, BaseSequenceGenerator
+        ) or not isinstance(args, tuple):
+            raise IncorrectArgumentTypeError(
+                'Incorrect generator argument type'
+            )
+        if kind not in BUNDLE_KINDS:
+            raise InvalidArgumentValueError('Invalid generator argument value')
+
+    def _bound(self, generator):
+        generator = copy.copy(generator)
+        generator.bundle = self
+        return generator
+
+    def _write_entry(self, generator):
+        if generator.max_sequence < len(generator.sequence):
+            raise InvalidSequenceLen(
+                'Sequence length is greater than a given value'
+            )
+        data = generator._data_to_write(self.path)
+        if isinstance(data['sequence'], CompactDictView):
+            data['sequence'] = data['sequence'].to_dict()
+        self.file.write(
+            (',\n' if self.count else '\n') + json.dumps(self.name) + ': '
+            + json.dumps(data)
+        )
+        self.count += 1
+
+    def _write_stream_entry(self, generator, elements):
+        self.file.write(
+            (',\n' if self.count else '\n') + json.dumps(self.name) + ': '
+        )
+        generator._stream_json_data(self.file, elements)
+        self.count += 1
+
+    def generate(self, specs):
+        specs = list(specs)
+        for spec in specs:
+            self._valid_spec(spec)
+        if len({spec[0] for spec in specs}) != len(specs):
+            raise InvalidArgumentValueError('Invalid generator argument value')
+        with self.lock:
+            self.date_stamp = datetime.now().strftime(DATE_STAMP)
+            self.count = 0
+            try:
+                with _atomic_write(
+                        self.path, buffering=BUNDLE_BUFFER_SIZE
+                ) as self.file:
+                    self.file.write('{"sequences": {')
+                    for name, generator, kind, args in specs:
+                        self.name = name
+                        getattr(
+                            self._bound(generator),
+                            f'generate_{kind}_sequence'
+                        )('json', *args)
+                    self.file.write('\n}, "meta": ' + json.dumps({
+                        'author': self.__class__.__name__,
+                        'seq_count': self.count,
+                        'date_created': self.date_stamp
+                    }) + '}\n')
+            finally:
+                self.file = self.name = None
+                self.entries = self.entries_key = None
+
+    def _entries(self):
+        file_key = ReadCache.file_key(self.path)
+        if self.entries is None or file_key is None or (
+            file_key != self.entries_key
+        ):
+            try:
+                with open(self.path, 'rb') as file:
+                    data = SERIALISERS.get('json').load(file)
+            except FileNotFoundError:
+                return {}
+            except ValueError:
+                raise InvalidJson('Invalid json file')
+            self.entries = data.get('sequences')
+            if not isinstance(self.entries, dict):
+                raise InvalidJson('Invalid json file')
+            self.entries_key = file_key
+        return self.entries
+
+    def get_sequence(self, name, generator, *args, **kwargs):
+        with self.lock:
+            self.entry = self._entries().get(name)
+            if self.entry is None:
+                raise SequenceNotFound(
+                    'Sequence with given name is not found'
+                )
+            try:
+                return self._bound(generator).get_sequence(*args, **kwargs)
+            finally:
+                self.entry = None
+
+    def __contains__(self, name):
+        with self.lock:
+            return name in self._entries()
+
+    def __iter__(self):
+        with self.lock:
+            return iter(list(self._entries()))
+
+    def __len__(self):
+        with self.lock:
+            return len(self._entries())
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.path!r})'
+
+
+class SequenceIndex:
+    __slots__ = (
+        'generator', 'source_path', 'index_path', 'mapped', 'view', 'key',
+        'lock'
+    )
+
+    def __init__(self, generator):
+        if not isinstance(generator, BaseSequenceGenerator):
+            raise IncorrectArgumentTypeError(
+                'Incorrect generator argument type'
+            )
+        self.generator = generator
+        self.source_path = self.index_path = None
+        self.mapped = self.view = self.key = None
+        self.lock = threading.RLock()
+        self._source_key()
+
+    def _source_key(self):
+        stored_files = [
+            path for path in self.generator.file_paths.values()
+            if os.path.isfile(path)
+        ]
+        if len(stored_files) != 1:
+            raise SequenceNotFound('Sequence with given name is not found')
+        self.source_path = stored_files[0]
+        self.index_path = self.source_path + INDEX_SUFFIX
+        try:
+            file_stat = os.stat(self.source_path)
+        except FileNotFoundError:
+            raise SequenceNotFound('Sequence with given name is not found')
+        return (
+            file_stat.st_dev, file_stat.st_ino, file_stat.st_mtime_ns,
+            file_stat.st_size
+        )
+
+    def _build(self, key):
+        sequence = self.generator.get_sequence()
+        if isinstance(sequence, Mapping):
+            sequence = sequence.values()
+        elements = sorted(sequence)
+        width = max(
+            (max(abs(elements[0]), abs(elements[-1])).bit_length() // 8 + 1
+             if elements else 8), 8
+        )
+        with _atomic_write(self.index_path, 'wb') as file:
+            file.write(INDEX_HEADER.pack(
+                INDEX_MAGIC, INDEX_VERSION, sys.byteorder[0].encode(), width,
+                len(elements), *key
+            ).ljust(INDEX_DATA_OFFSET, b'\0'))
+            if width == 8:
+                for i in range(0, len(elements), CHUNK_SIZE):
+                    array('q', elements[i:i + CHUNK_SIZE]).tofile(file)
+            else:
+                for element in elements:
+                    file.write(
+                        element.to_bytes(width, sys.byteorder, signed=True)
+                    )
+
+    def _open(self, key):
+        try:
+            with open(self.index_path, 'rb') as file:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            return False
+        try:
+            magic, version, byteorder, width, count, *index_key = (
+                INDEX_HEADER.unpack_from(mapped)
+            )
+        except struct.error:
+            mapped.close()
+            return False
+        if (magic, version, byteorder) != (
+            INDEX_MAGIC, INDEX_VERSION, sys.byteorder[0].encode()
+        ) or tuple(index_key) != key or width < 8 or (
+            len(mapped) != INDEX_DATA_OFFSET + count * width
+        ):
+            mapped.close()
+            return False
+        self.close()
+        data = memoryview(mapped)[INDEX_DATA_OFFSET:]
+        self.view = data.cast('q') if width == 8 else WideIndexView(
+            data, width
+        )
+        self.mapped = mapped
+        self.key = key
+        return True
+
+    def _current_view(self):
+        key = self._source_key()
+        if key != self.key and not self._open(key):
+            self._build(key)
+            if not self._open(key):
+                raise InvalidBinary('Invalid binary file')
+        return self.view
+
+    @staticmethod
+    def _valid_bounds(*bounds):
+        if not all(
+                isinstance(x, int) and not isinstance(x, bool) for x in bounds
+        ):
+            raise IncorrectArgumentTypeError(
+                'Incorrect generator argument type'
+            )
+        if bounds != tuple(sorted(bounds)):
+            raise InvalidArgumentValueError('Invalid generator argument value')
+
+    def _bounds(self, start, end):
+        self._valid_bounds(start, end)
+        view = self._current_view()
+        return view, bisect.bisect_left(view, start), bisect.bisect_left(
+            view, end
+        )
+
+    def contains(self, element):
+        self._valid_bounds(element)
+        with self.lock:
+            view = self._current_view()
+            index = bisect.bisect_left(view, element)
+            return index < len(view) and view[index] == element
+
+    def count_between(self, start, end):
+        with self.lock:
+            _, low, high = self._bounds(start, end)
+            return high - low
+
+    def range(self, start, end):
+        with self.lock:
+            view, low, high = self._bounds(start, end)
+            elements = view[low:high]
+            if isinstance(elements, memoryview):
+                return elements.tolist()
+            return elements
+
+    def close(self):
+        if self.view is not None:
+            if isinstance(self.view, WideIndexView):
+                self.view.data.release()
+            else:
+                self.view.release()
+            self.mapped.close()
+        self.mapped = self.view = self.key = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        with self.lock:
+            return len(self._current_view())
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.source_path!r})'
+
+
+def test_meta_data(*args):
+    import xml.etree.ElementTree as ET
+    test_generator_name = None
+    test_seq_type = None
+    test_seq_len = None
+    test_el_type = None
+    test_author = None
+    test_min_element = None
+    test_max_element = None
+    author = None
+    element_type = None
+    if len(args) == 5:
+        file_type, rand_start, rand_end, rand_step, seq_type = args
+        if file_type == 'xml':
+            with open(PATH_XML, 'r') as file:
+                loaded_data = ET.parse(file)
+                meta_info = loaded_data.findall('meta')
+                path_tuple = (
+                    'generator_name', 'seq_type', 'seq_len', 'el_type',
+                    'date_created', 'date_modified', 'author',
+                    'min_element', 'max_element'
+                )
+                value_list = []
+                for info in meta_info:
+                    for path in path_tuple:
+                        meta_keys = info.findall(path)
+                        for val in meta_keys:
+                            value_list.append(val.text)
+                assert len(value_list) == 9, 'invalid number of meta info'
+                test_generator_name = ''.join(value_list[0])
+                test_seq_type = ''.join(value_list[1])
+                test_seq_len = int(''.join(value_list[2]))
                 test_el_type = ''.join(value_list[3])
                 test_author = ''.join(value_list[6])
                 test_min_element = ''.join(value_list[7])
@@ -876,6 +3097,1409 @@ def test_negative():
             )
             
 
+def test_stream_json():
+    import tracemalloc
+    rand_start = random.randint(-20, 0)
+    rand_end = random.randint(1, 20)
+    rand_step = random.randint(1, 3)
+    for generator in (
+        ListSequenceGenerator(), TupleSequenceGenerator(),
+        SetSequenceGenerator(), DictSequenceGenerator()
+    ):
+        specs = [('range', rand_start, rand_end, rand_step)]
+        if isinstance(generator, ListSequenceGenerator) and (
+            generator.__class__ is not SetSequenceGenerator
+        ):
+            specs.append(('fibonacci', (3, 6), 10))
+        for args in specs:
+            if args[0] == 'range':
+                generator.generate_range_sequence('json', *args[1:])
+            else:
+                generator.generate_fibonacci_sequence('json', *args[1:])
+            with open(PATH_JSON, 'r') as file:
+                expected = json.load(file)
+            expected_sequence = generator.get_sequence()
+            if args[0] == 'range':
+                generator.generate_range_sequence(
+                    'json', *args[1:], stream=True
+                )
+            else:
+                generator.generate_fibonacci_sequence(
+                    'json', *args[1:], stream=True
+                )
+            with open(PATH_JSON, 'r') as file:
+                streamed = json.load(file)
+            assert sorted(streamed['sequence']) == sorted(
+                expected['sequence']
+            ), 'Streamed sequence is invalid'
+            for key in ('date_created', 'date_modified'):
+                del streamed['meta'][key], expected['meta'][key]
+            assert streamed['meta'] == expected['meta'], 'Streamed meta'
+            assert generator.get_sequence() == expected_sequence, (
+                'Getting streamed sequence failed'
+            )
+
+    fibonacci = list(BaseSequenceGenerator.fibonacci_window((5, -3), 0, 10))
+    for file_type in ('json', 'xml', 'bin'):
+        metas = []
+        for generator, kwargs in (
+                (ListSequenceGenerator(), {}),
+                (ListSequenceGenerator(), {'stream': True}),
+                (ListSequenceGenerator(), {
+                    'workers': 2 if file_type in PARALLEL_TYPES else 1
+                }),
+                (ListSequenceGenerator(memory_budget=10 ** 6), {})
+        ):
+            GENERATION_CACHE.clear()
+            _remove_files(*FILE_PATHS.values())
+            generator.generate_fibonacci_sequence(
+                file_type, (5, -3), 10, **kwargs
+            )
+            metas.append(_stored_header(FILE_PATHS[file_type])['meta'])
+        assert metas[0]['min_element'] == str(min(fibonacci)), 'Meta min'
+        assert metas[0]['max_element'] == str(max(fibonacci)), 'Meta max'
+        assert all(meta == metas[0] for meta in metas), (
+            'Meta depends on the generation mode'
+        )
+    DictSequenceGenerator().generate_fibonacci_sequence('json', (5, -3), 10)
+    with open(PATH_JSON, 'r') as file:
+        assert json.load(file)['meta']['min_element'] == str(
+            min(fibonacci)
+        ), 'Dict meta min'
+
+    big_seq = ListSequenceGenerator(10 ** 5)
+    tracemalloc.start()
+    big_seq.generate_range_sequence('json', 0, 10 ** 5, stream=True)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert peak < 10 ** 6, 'Streaming writer memory is not constant'
+    assert big_seq.get_sequence() == list(range(10 ** 5)), 'Big stream'
+    try:
+        ListSequenceGenerator(10).generate_range_sequence(
+            'json', 0, 11, stream=True
+        )
+    except Exception as e:
+        assert isinstance(e, InvalidSequenceLen), 'InvalidSequenceLen'
+
+
+def test_stream_xml():
+    import tracemalloc
+    big_seq = ListSequenceGenerator(3 * 10 ** 4)
+    big_seq.generate_range_sequence('xml', 0, 3 * 10 ** 4)
+    tracemalloc.start()
+    sequence = big_seq.get_sequence()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert sequence == list(range(3 * 10 ** 4)), 'Streamed xml sequence'
+    assert peak < 1.5 * current, 'Xml reader memory is not constant'
+    try:
+        TupleSequenceGenerator(10).get_sequence()
+    except Exception as e:
+        assert isinstance(e, InvalidSequenceLen), 'InvalidSequenceLen'
+    try:
+        DictSequenceGenerator(10).get_sequence()
+    except Exception as e:
+        assert isinstance(e, BadSeqType), 'BadSeqType'
+
+    DictSequenceGenerator().generate_range_sequence('xml', -5, 5)
+    assert DictSequenceGenerator().get_sequence() == {
+        str(i): i for i in range(-5, 5)
+    }, 'Streamed xml dict'
+    with open(PATH_XML, 'r+') as file:
+        file.seek(random.randint(40, 60))
+        file.write('<elem>')
+    try:
+        DictSequenceGenerator().get_sequence()
+    except Exception as e:
+        assert isinstance(e, InvalidXML), 'InvalidXML'
+
+
+def test_serialise_xml():
+    import xml.etree.ElementTree as ET
+    from xml.dom import minidom
+    rand_start = random.randint(-20, 0)
+    rand_end = random.randint(1, 20)
+    rand_step = random.randint(1, 3)
+    for generator in (
+        ListSequenceGenerator(), TupleSequenceGenerator(),
+        SetSequenceGenerator(), DictSequenceGenerator()
+    ):
+        for stream in (False, True):
+            if os.path.isfile(PATH_XML):
+                os.remove(PATH_XML)
+            generator.generate_range_sequence(
+                'xml', rand_start, rand_end, rand_step, stream=stream
+            )
+            with open(PATH_XML, 'r') as file:
+                xml_str = file.read()
+            root = ET.fromstring(xml_str)
+            for element in root.iter():
+                element.tail = None
+                if element.text and not element.text.strip():
+                    element.text = None
+            pretty_xml = minidom.parseString(
+                ET.tostring(root)
+            ).toprettyxml(indent='    ')
+            assert xml_str == pretty_xml, 'Xml is not pretty printed'
+            test_meta_data(
+                'xml', rand_start, rand_end, rand_step, generator.seq_type
+            )
+            sequence = generator.get_sequence()
+            if isinstance(sequence, dict):
+                sequence = sequence.values()
+            assert sorted(sequence) == list(
+                range(rand_start, rand_end, rand_step)
+            ), 'Serialised xml sequence is invalid'
+
+    big_seq = TupleSequenceGenerator(10 ** 5)
+    big_seq.generate_range_sequence('xml', 0, 10 ** 5)
+    assert big_seq.get_sequence() == tuple(range(10 ** 5)), 'Big xml'
+
+
+def test_header():
+    for file_type in ('json', 'xml'):
+        file_path = PATH_JSON if file_type == 'json' else PATH_XML
+        list_seq = ListSequenceGenerator()
+        list_seq.generate_range_sequence(file_type, 0, 20, 2)
+        assert os.path.isfile(file_path + HEADER_SUFFIX), 'No header file'
+        modified = os.stat(file_path).st_mtime_ns
+        fresh_seq = ListSequenceGenerator()
+        fresh_seq.generate_range_sequence(file_type, 0, 20, 2)
+        assert fresh_seq.loaded_data is None, 'Fresh file was parsed'
+        assert os.stat(file_path).st_mtime_ns == modified, 'Fresh rewrite'
+
+        with open(file_path, 'r+') as file:
+            file.seek(random.randint(3, 6))
+            file.write('<I live Python>')
+        fresh_seq.generate_range_sequence(file_type, 0, 20, 2)
+        assert fresh_seq.get_sequence() == list(range(0, 20, 2)), (
+            'Changed file was not rewritten'
+        )
+        fresh_seq.generate_range_sequence(file_type, 0, 22, 2)
+        assert fresh_seq.get_sequence() == list(range(0, 22, 2)), (
+            'New sequence was not written'
+        )
+        TupleSequenceGenerator().generate_range_sequence(file_type, 0, 22, 2)
+        with open(file_path + HEADER_SUFFIX, 'r') as header_file:
+            assert json.load(header_file)['meta']['seq_type'] == 'tuple', (
+                'Header meta was not updated'
+            )
+
+
+def test_generation_cache():
+    GENERATION_CACHE.clear()
+    for file_type in ('json', 'xml'):
+        file_path = PATH_JSON if file_type == 'json' else PATH_XML
+        ListSequenceGenerator().generate_range_sequence(file_type, 1, 40, 3)
+        modified = os.stat(file_path).st_mtime_ns
+        list_seq = ListSequenceGenerator()
+        list_seq.generate_range_sequence(file_type, 1, 40, 3)
+        assert list_seq.sequence is None, 'Cached spec was regenerated'
+        assert os.stat(file_path).st_mtime_ns == modified, 'Cached rewrite'
+        try:
+            ListSequenceGenerator(5).generate_range_sequence(
+                file_type, 1, 40, 3
+            )
+        except Exception as e:
+            assert isinstance(e, InvalidSequenceLen), 'InvalidSequenceLen'
+
+        hits = GENERATION_CACHE.hits
+        tuple_seq = TupleSequenceGenerator()
+        tuple_seq.generate_range_sequence(file_type, 1, 40, 3)
+        assert GENERATION_CACHE.hits == hits + 1, 'Payload was not reused'
+        assert tuple_seq.get_sequence() == tuple(range(1, 40, 3)), (
+            'Cached payload is invalid'
+        )
+        test_meta_data(file_type, 1, 40, 3, 'tuple')
+    assert GENERATION_CACHE.artifact_hits == 2, 'Artifact hits'
+    assert GENERATION_CACHE.stats()['misses'] == 1, 'Payload misses'
+
+    small_cache = GenerationCache(max_elements=10)
+    small_cache.put_payload('first', (tuple(range(6)), 0, 5, 6))
+    small_cache.put_payload('second', (tuple(range(6)), 0, 5, 6))
+    assert small_cache.get_payload('first') is None, 'Cache was not evicted'
+    assert small_cache.get_payload('second') is not None, 'Evicted too much'
+    assert small_cache.stats()['size'] == 6, 'Cache size'
+
+
+def test_binary():
+    rand_start = random.randint(-20, 0)
+    rand_end = random.randint(1, 20)
+    rand_step = random.randint(1, 3)
+    for generator in (
+        ListSequenceGenerator(), TupleSequenceGenerator(),
+        SetSequenceGenerator(), DictSequenceGenerator()
+    ):
+        for stream in (False, True):
+            generator.generate_range_sequence(
+                'bin', rand_start, rand_end, rand_step, stream=stream
+            )
+            for path in (PATH_JSON, PATH_XML):
+                assert os.path.isfile(path) is False, 'Opposite file exists'
+            sequence = generator.get_sequence()
+            if isinstance(sequence, dict):
+                assert sequence == {
+                    str(x): x for x in range(rand_start, rand_end, rand_step)
+                }, 'Binary dict sequence is invalid'
+            else:
+                assert sorted(sequence) == list(
+                    range(rand_start, rand_end, rand_step)
+                ), 'Binary sequence is invalid'
+
+    list_seq = ListSequenceGenerator(10 ** 5)
+    list_seq.generate_range_sequence('bin', -10 ** 5, 10 ** 5, 2)
+    view = list_seq.get_sequence(zero_copy=True)
+    assert isinstance(view, memoryview) and isinstance(view.obj, mmap.mmap), (
+        'Binary sequence is not a zero-copy view'
+    )
+    assert view.tolist() == list(range(-10 ** 5, 10 ** 5, 2)), 'Binary view'
+    bin_size = os.path.getsize(PATH_BIN)
+    list_seq.generate_range_sequence('json', -10 ** 5, 10 ** 5, 2)
+    assert bin_size < os.path.getsize(PATH_JSON), 'Binary is not compact'
+
+    for stream in (False, True):
+        list_seq.generate_fibonacci_sequence(
+            'bin', (-3, 1), 200, stream=stream
+        )
+        fib = [-3, 1]
+        while len(fib) < 200:
+            fib.append(fib[-2] + fib[-1])
+        assert list_seq.get_sequence() == fib, 'Binary big ints are invalid'
+        assert list_seq.get_sequence(zero_copy=True) == fib, 'Big int view'
+    try:
+        TupleSequenceGenerator(10).get_sequence()
+    except Exception as e:
+        assert isinstance(e, InvalidSequenceLen), 'InvalidSequenceLen'
+    try:
+        DictSequenceGenerator().get_sequence()
+    except Exception as e:
+        assert isinstance(e, BadSeqType), 'BadSeqType'
+    with open(PATH_BIN, 'r+b') as file:
+        file.write(b'JSON')
+    try:
+        list_seq.get_sequence()
+    except Exception as e:
+        assert isinstance(e, InvalidBinary), 'InvalidBinary'
+
+    for corrupt in ('escape_len', 'escape_data', 'truncated'):
+        list_seq.generate_fibonacci_sequence('bin', (-3, 1), 200)
+        with open(PATH_BIN, 'r+b') as file:
+            header = BIN_HEADER.unpack(file.read(BIN_HEADER.size))
+            escape_offset = BIN_DATA_OFFSET + header[3] * 8
+            if corrupt == 'escape_len':
+                file.seek(escape_offset)
+                file.write(BIN_ESCAPE_LEN.pack(0xFFFFFFFF))
+            elif corrupt == 'escape_data':
+                file.seek(escape_offset)
+                file.write(BIN_ESCAPE_LEN.pack(header[5] - escape_offset))
+            else:
+                file.truncate(header[5] + header[6] - 1)
+        try:
+            list_seq.get_sequence()
+        except Exception as e:
+            assert isinstance(e, InvalidBinary), 'Corrupt escape area'
+        else:
+            assert False, 'Corrupt escape area was decoded'
+
+
+def test_packed():
+    rand_start = random.randint(-20, 0)
+    rand_end = random.randint(1, 20)
+    rand_step = random.randint(1, 3)
+    for file_type in ('gzip', 'bz2', 'lzma'):
+        file_path = FILE_PATHS[file_type]
+        for generator in (
+            ListSequenceGenerator(), TupleSequenceGenerator(),
+            SetSequenceGenerator(), DictSequenceGenerator()
+        ):
+            generator.generate_range_sequence(
+                file_type, rand_start, rand_end, rand_step,
+                stream=random.choice([True, False])
+            )
+            assert [
+                path for path in FILE_PATHS.values() if os.path.isfile(path)
+            ] == [file_path], 'Opposite file exists'
+            sequence = generator.get_sequence()
+            if isinstance(sequence, dict):
+                assert sequence == {
+                    str(x): x for x in range(rand_start, rand_end, rand_step)
+                }, 'Packed dict sequence is invalid'
+            else:
+                assert sorted(sequence) == list(
+                    range(rand_start, rand_end, rand_step)
+                ), 'Packed sequence is invalid'
+
+        list_seq = ListSequenceGenerator(10 ** 5)
+        list_seq.generate_fibonacci_sequence(file_type, (5, -3), 300)
+        fib = [5, -3]
+        while len(fib) < 300:
+            fib.append(fib[-2] + fib[-1])
+        assert list_seq.get_sequence() == fib, 'Packed big ints are invalid'
+        with CODECS[file_type][1].open(file_path, 'rb') as file:
+            meta = json.loads(file.read().rsplit(b'\x00', 1)[1])
+        assert meta['codec'] == file_type, 'Codec is not recorded in meta'
+
+        class ShortReads:
+            def __init__(self, file):
+                self.file = file
+                self.sizes = []
+
+            def read(self, size):
+                self.sizes.append(size)
+                return self.file.read(min(size, 7))
+
+        with CODECS[file_type][1].open(file_path, 'rb') as file:
+            short_reads = ShortReads(file)
+            stream = VarintStream(short_reads)
+            assert stream.read_bytes(4) == PACKED_MAGIC, 'Packed magic'
+            chunk_len, = stream.read_varints(1)
+            zigzags = stream.read_varints(chunk_len)
+            assert stream.read_varints(1) == [0], 'Packed end marker'
+            assert json.loads(stream.read_rest()) == meta, 'Packed meta'
+        assert list(accumulate(
+            zigzag >> 1 ^ -(zigzag & 1) for zigzag in zigzags
+        )) == fib, 'Partial varints across blocks'
+        assert all(
+            0 < size <= PACKED_BLOCK_SIZE for size in short_reads.sizes
+        ), 'Packed reader is not bounded'
+
+        list_seq.generate_range_sequence(file_type, 0, 10 ** 5, 3)
+        packed_size = os.path.getsize(file_path)
+        assert list_seq.get_sequence() == list(range(0, 10 ** 5, 3)), (
+            'Packed range is invalid'
+        )
+        list_seq.generate_range_sequence('json', 0, 10 ** 5, 3)
+        assert packed_size * 10 < os.path.getsize(PATH_JSON), (
+            'Packed file is not compact'
+        )
+
+        list_seq.generate_range_sequence(file_type, 0, 30)
+        try:
+            TupleSequenceGenerator(10).get_sequence()
+        except Exception as e:
+            assert isinstance(e, InvalidSequenceLen), 'InvalidSequenceLen'
+        try:
+            DictSequenceGenerator().get_sequence()
+        except Exception as e:
+            assert isinstance(e, BadSeqType), 'BadSeqType'
+        with open(file_path, 'r+b') as file:
+            file.seek(random.randint(0, 6))
+            file.write(b'<I live Python>')
+        try:
+            list_seq.get_sequence()
+        except Exception as e:
+            assert isinstance(e, InvalidBinary), 'InvalidBinary'
+
+
+def test_range_storage():
+    rand_start = random.randint(-20, 0)
+    rand_end = random.randint(1, 20)
+    rand_step = random.randint(1, 3)
+    expected = list(range(rand_start, rand_end, rand_step))
+    for generator, view_type, container in (
+        (ListSequenceGenerator(), RangeListView, list),
+        (TupleSequenceGenerator(), RangeTupleView, tuple),
+        (SetSequenceGenerator(), RangeSetView, set)
+    ):
+        generator.generate_range_sequence(
+            'range', rand_start, rand_end, rand_step
+        )
+        with open(PATH_RANGE, 'r') as file:
+            meta = json.load(file)['meta']
+        assert (
+            meta['seq_len'], meta['min_element'], meta['max_element']
+        ) == (len(expected), expected[0], expected[-1]), 'Range meta'
+        sequence = generator.get_sequence()
+        assert isinstance(sequence, view_type), 'Range view type'
+        assert sequence == container(expected), 'Range view is invalid'
+        assert len(sequence) == len(expected), 'Range view len'
+        assert rand_start in sequence and rand_end not in sequence, (
+            'Range view membership'
+        )
+    dict_seq = DictSequenceGenerator()
+    dict_seq.generate_range_sequence('range', rand_start, rand_end, rand_step)
+    sequence = dict_seq.get_sequence()
+    assert isinstance(sequence, RangeDictView), 'Range dict view type'
+    assert sequence == {str(x): x for x in expected}, 'Range dict view'
+    assert sequence.get(str(rand_end)) is None, 'Range dict view lookup'
+
+    huge_seq = ListSequenceGenerator(10 ** 15)
+    huge_seq.generate_range_sequence('range', 0, 10 ** 15, 7)
+    assert os.path.getsize(PATH_RANGE) < 1024, 'Range file is not O(1)'
+    sequence = huge_seq.get_sequence()
+    assert len(sequence) == len(range(0, 10 ** 15, 7)), 'Huge range len'
+    assert sequence[-1] == range(0, 10 ** 15, 7)[-1], 'Huge range index'
+    assert sequence[10:13] == [70, 77, 84], 'Huge range slice'
+    try:
+        ListSequenceGenerator(10).get_sequence()
+    except Exception as e:
+        assert isinstance(e, InvalidSequenceLen), 'InvalidSequenceLen'
+    try:
+        DictSequenceGenerator().get_sequence()
+    except Exception as e:
+        assert isinstance(e, BadSeqType), 'BadSeqType'
+    try:
+        huge_seq.generate_fibonacci_sequence('range', (1, 2), 10)
+    except Exception as e:
+        assert isinstance(e, InvalidFileTypeArgument), 'Fibonacci range'
+
+
+def test_fibonacci_engine():
+    for i in range(100):
+        fibonacci_pair = (random.randint(-50, 50), random.randint(-50, 50))
+        fib = list(fibonacci_pair)
+        while len(fib) < 300:
+            fib.append(fib[-2] + fib[-1])
+        index = random.randint(0, 299)
+        start = random.randint(0, 299)
+        end = random.randint(start, 300)
+        assert BaseSequenceGenerator.fibonacci_term(
+            fibonacci_pair, index
+        ) == fib[index], 'Fibonacci term is invalid'
+        assert list(BaseSequenceGenerator.fibonacci_window(
+            fibonacci_pair, start, end
+        )) == fib[start:end], 'Fibonacci window is invalid'
+
+    term = ListSequenceGenerator.fibonacci_term((0, 1), 10 ** 5)
+    assert term % 10 ** 5 == 46875 and term.bit_length() == 69424, (
+        'Far Fibonacci term is invalid'
+    )
+    for args in (((0, 1), -1), ((0, 1), '1'), ([0, 1], 1), ((0, 1), True)):
+        try:
+            BaseSequenceGenerator.fibonacci_term(*args)
+        except Exception as e:
+            assert isinstance(e, (
+                InvalidArgumentValueError, IncorrectArgumentTypeError
+            )), 'Invalid Fibonacci term argument'
+    try:
+        list(BaseSequenceGenerator.fibonacci_window((0, 1), 5, 4))
+    except Exception as e:
+        assert isinstance(e, InvalidArgumentValueError), 'Invalid window'
+
+
+def test_parallel():
+    for file_type in ('json', 'xml'):
+        file_path = FILE_PATHS[file_type]
+        for generator, method, args in (
+            (ListSequenceGenerator(10 ** 5), 'generate_range_sequence',
+             (-10 ** 4, 10 ** 5, 3)),
+            (DictSequenceGenerator(10 ** 5), 'generate_range_sequence',
+             (-10 ** 4, 10 ** 5, 3)),
+            (TupleSequenceGenerator(10 ** 5), 'generate_fibonacci_sequence',
+             ((7, -2), 5000))
+        ):
+            GENERATION_CACHE.clear()
+            getattr(generator, method)(file_type, *args, stream=True)
+            with open(file_path, 'r') as file:
+                serial = file.read()
+            GENERATION_CACHE.clear()
+            getattr(generator, method)(file_type, *args, workers=2)
+            with open(file_path, 'r') as file:
+                parallel = file.read()
+            date_stamp = re.compile(r'\d{2}-\d{2}-\d{4} \d{2}:\d{2}')
+            assert date_stamp.sub('', parallel) == date_stamp.sub(
+                '', serial
+            ), 'Parallel output differs from serial output'
+    for file_type in BINARY_TYPES:
+        try:
+            ListSequenceGenerator().generate_range_sequence(
+                file_type, 0, 10, workers=2
+            )
+        except Exception as e:
+            assert isinstance(e, InvalidArgumentValueError), (
+                'Binary workers are not rejected'
+            )
+        else:
+            assert False, 'Binary workers are silently ignored'
+    for workers in (0, -1, '2', True, 2.0):
+        try:
+            ListSequenceGenerator().generate_range_sequence(
+                'json', 0, 10, workers=workers
+            )
+        except Exception as e:
+            assert isinstance(e, (
+                InvalidArgumentValueError, IncorrectArgumentTypeError
+            )), 'Invalid workers argument'
+
+
+def test_async():
+    import asyncio
+    from concurrent.futures import ProcessPoolExecutor
+
+    async def ticker(ticks, done):
+        while not done.is_set():
+            ticks.append(1)
+            await asyncio.sleep(0)
+
+    async def generate_and_get():
+        ticks = []
+        done = asyncio.Event()
+        ticker_task = asyncio.create_task(ticker(ticks, done))
+        big_seq = ListSequenceGenerator(10 ** 5)
+        await big_seq.agenerate_range_sequence('xml', 0, 10 ** 5, 3)
+        sequence = await big_seq.aget_sequence()
+        done.set()
+        await ticker_task
+        assert sequence == list(range(0, 10 ** 5, 3)), 'Async round trip'
+        assert len(ticks) > 1, 'Event loop was blocked'
+
+        generators = [
+            generator_class()
+            for generator_class in (
+                ListSequenceGenerator, TupleSequenceGenerator,
+                SetSequenceGenerator
+            ) for _ in range(5)
+        ]
+        results = await asyncio.gather(
+            *(x.agenerate_fibonacci_sequence('json', (2, 5), 10)
+              for x in generators[:5]),
+            *(x.aget_sequence() for x in generators[:10])
+        )
+        fib = [2, 5, 7, 12, 19, 31, 50, 81, 131, 212]
+        assert results[5:10] == [fib] * 5, 'Async list get failed'
+        assert results[10:] == [tuple(fib)] * 5, 'Async tuple get failed'
+        try:
+            await DictSequenceGenerator().aget_sequence()
+        except Exception as e:
+            assert isinstance(e, BadSeqType), 'Async BadSeqType'
+
+    async def concurrent_files(directory):
+        stored_lock = _file_lock(os.path.abspath(PATH_JSON))
+        stored_lock.acquire()
+        try:
+            blocked = asyncio.create_task(
+                ListSequenceGenerator().agenerate_range_sequence(
+                    'json', 0, 10
+                )
+            )
+            other_seq = ListSequenceGenerator()
+            other_seq.file_paths = {
+                'json': os.path.join(directory, 'other.json')
+            }
+            await asyncio.wait_for(
+                other_seq.agenerate_range_sequence('json', 0, 10), 5
+            )
+            assert await other_seq.aget_sequence() == list(range(10)), (
+                'Async sequence in other file'
+            )
+            assert not blocked.done(), 'File lock was not taken'
+        finally:
+            stored_lock.release()
+        await blocked
+        try:
+            with ProcessPoolExecutor(1) as executor:
+                await other_seq.aget_sequence(executor=executor)
+        except Exception as e:
+            assert isinstance(e, IncorrectArgumentTypeError), (
+                'Process executor'
+            )
+        else:
+            assert False, 'Process executor was accepted'
+
+    set_async_limit(2)
+    try:
+        asyncio.run(generate_and_get())
+        asyncio.run(generate_and_get())
+        with tempfile.TemporaryDirectory() as directory:
+            asyncio.run(concurrent_files(directory))
+    finally:
+        set_async_limit(8)
+    for limit in (0, '2', True):
+        try:
+            set_async_limit(limit)
+        except Exception as e:
+            assert isinstance(e, (
+                InvalidArgumentValueError, IncorrectArgumentTypeError
+            )), 'Invalid async limit'
+
+
+def test_store():
+    from concurrent.futures import ThreadPoolExecutor
+
+    default_files = [path for path in FILE_PATHS.values() if os.path.isfile(
+        path
+    )]
+    with tempfile.TemporaryDirectory() as directory:
+        store = SequenceStore(directory)
+        store.generate_range_sequence(
+            'evens', ListSequenceGenerator(), 'json', 0, 20, 2
+        )
+        store.generate_fibonacci_sequence(
+            'fib', TupleSequenceGenerator(), 'xml', (2, 5), 6
+        )
+        store.generate_range_sequence(
+            'keys', DictSequenceGenerator(), 'bin', 1, 4
+        )
+        assert sorted(store) == ['evens', 'fib', 'keys'], 'Store index'
+        assert len(store) == 3 and 'fib' in store, 'Store index'
+        assert store.index()['fib']['file_type'] == 'xml', 'Index file type'
+        assert store.index()['fib']['meta']['seq_len'] == '6', 'Index meta'
+        assert store.get_sequence('evens', ListSequenceGenerator()) == list(
+            range(0, 20, 2)
+        ), 'Store list'
+        assert store.get_sequence('fib', TupleSequenceGenerator()) == (
+            2, 5, 7, 12, 19, 31
+        ), 'Store tuple'
+        assert store.get_sequence('keys', DictSequenceGenerator()) == {
+            '1': 1, '2': 2, '3': 3
+        }, 'Store dict'
+
+        store.generate_range_sequence(
+            'evens', ListSequenceGenerator(), 'gzip', 0, 30, 2
+        )
+        assert store.get_sequence('evens', ListSequenceGenerator()) == list(
+            range(0, 30, 2)
+        ), 'Store format switch'
+        assert sorted(
+            name for name in os.listdir(directory)
+            if name.startswith('evens.') and not name.endswith(LOCK_SUFFIX)
+        ) == ['evens.gz', 'evens.gz.meta'], 'Stale store files'
+        store.remove('keys')
+        assert 'keys' not in store and not os.path.isfile(
+            os.path.join(directory, 'keys.bin')
+        ), 'Store remove'
+        for name, exception in (
+                ('keys', SequenceNotFound),
+                ('.index', InvalidArgumentValueError),
+                ('a/b', InvalidArgumentValueError),
+                (1, IncorrectArgumentTypeError)
+        ):
+            try:
+                store.get_sequence(name, ListSequenceGenerator())
+            except Exception as e:
+                assert isinstance(e, exception), 'Invalid store name'
+            else:
+                assert False, 'Invalid store name'
+        try:
+            store.generate_range_sequence(
+                'bad', ListSequenceGenerator(), 'csv', 0, 3
+            )
+        except Exception as e:
+            assert isinstance(e, InvalidFileTypeArgument), 'Store file type'
+
+        lengths = (10, 50, 90)
+        file_types = ('json', 'xml', 'bin', 'lzma')
+
+        def write(task):
+            name = f'seq{task % 4}'
+            store.generate_range_sequence(
+                name, ListSequenceGenerator(), file_types[task % 4 - 1],
+                0, lengths[task % 3]
+            )
+
+        def read(task):
+            for _ in range(20):
+                sequence = store.get_sequence(
+                    f'seq{task % 4}', ListSequenceGenerator()
+                )
+                assert sequence == list(range(len(sequence))) and len(
+                    sequence
+                ) in lengths, 'Torn store read'
+
+        for task in range(4):
+            write(task)
+        with ThreadPoolExecutor(16) as executor:
+            futures = [executor.submit(write, task) for task in range(24)]
+            futures += [executor.submit(read, task) for task in range(12)]
+            for future in futures:
+                future.result()
+        assert not any(
+            name.endswith(TEMP_SUFFIX) for name in os.listdir(directory)
+        ), 'Temporary store files left'
+        assert len(store) == 6, 'Concurrent store index'
+
+        shared_seq = ListSequenceGenerator()
+        shared_seq.generate_range_sequence('json', 0, 5)
+
+        def store_write(task):
+            store.generate_range_sequence(
+                f'shared{task % 3}', shared_seq, 'xml', 0, 10
+            )
+
+        def shared_read(task):
+            for _ in range(20):
+                assert shared_seq.get_sequence() == list(range(5)), (
+                    'Store used the shared generator'
+                )
+
+        with ThreadPoolExecutor(8) as executor:
+            futures = [executor.submit(store_write, x) for x in range(12)]
+            futures += [executor.submit(shared_read, x) for x in range(4)]
+            for future in futures:
+                future.result()
+        assert shared_seq.file_paths is FILE_PATHS, 'Store kept file paths'
+        assert shared_seq.incremental, 'Store changed incremental mode'
+    assert default_files == [path for path in FILE_PATHS.values() if (
+        os.path.isfile(path)
+    )], 'Store touched default files'
+
+
+def test_append():
+    def stored(generator_class, file_type, method, *args):
+        for path in FILE_PATHS.values():
+            _remove_files(path)
+        GENERATION_CACHE.clear()
+        getattr(generator_class(10 ** 4), method)(file_type, *args)
+        header = _stored_header(FILE_PATHS[file_type])
+        return generator_class(10 ** 4).get_sequence(), header['meta']
+
+    fib = BaseSequenceGenerator.fibonacci_window
+    for generator_class, method, first_args, args, expected in (
+            (ListSequenceGenerator, 'generate_range_sequence',
+             (5, 300, 3), (5, 3000, 3), list(range(5, 3000, 3))),
+            (TupleSequenceGenerator, 'generate_fibonacci_sequence',
+             ((2, 5), 10), ((2, 5), 40), tuple(fib((2, 5), 0, 40))),
+            (DictSequenceGenerator, 'generate_range_sequence',
+             (0, 10), (0, 25), {str(i): i for i in range(25)})
+    ):
+        for file_type in APPENDABLE_TYPES:
+            file_path = FILE_PATHS[file_type]
+            generator = generator_class(10 ** 4)
+            getattr(generator, method)(file_type, *first_args)
+            inode = os.stat(file_path).st_ino
+            stored_size = os.path.getsize(file_path)
+            GENERATION_CACHE.clear()
+            events = []
+            generator.add_observer(events.append)
+            getattr(generator, method)(file_type, *args)
+            generator.remove_observer(events.append)
+            phases = [x for x in events if x['event'] == 'phase']
+            assert os.stat(file_path).st_ino == inode, 'Sequence rewritten'
+            assert phases[0]['phase'] == 'append', 'Sequence rewritten'
+            grown = os.path.getsize(file_path) - stored_size
+            assert grown <= phases[0]['bytes_written'] < grown + 1024, (
+                'Appended bytes are not reported'
+            )
+            sequence = generator_class(10 ** 4).get_sequence()
+            meta = _stored_header(file_path)['meta']
+            assert sequence == expected, 'Appended sequence'
+            assert (sequence, meta) == stored(
+                generator_class, file_type, method, *args
+            ), 'Appended meta'
+
+    fsync = os.fsync
+
+    def failing_fsync(fd):
+        raise OSError('disk full')
+
+    for file_type in APPENDABLE_TYPES:
+        file_path = FILE_PATHS[file_type]
+        list_seq = ListSequenceGenerator(100)
+        list_seq.generate_range_sequence(file_type, 0, 10)
+        with open(file_path, 'rb') as file:
+            stored_data = file.read()
+        GENERATION_CACHE.clear()
+        os.fsync = failing_fsync
+        try:
+            list_seq.generate_range_sequence(file_type, 0, 20)
+        except OSError:
+            pass
+        else:
+            assert False, 'Append failure was not raised'
+        finally:
+            os.fsync = fsync
+        with open(file_path, 'rb') as file:
+            assert file.read() == stored_data, 'Failed append changed file'
+        assert not any(
+            name.endswith(TEMP_SUFFIX) for name in os.listdir()
+        ), 'Failed append left temporary files'
+        assert ListSequenceGenerator().get_sequence() == list(range(10)), (
+            'Failed append left unreadable file'
+        )
+
+    list_seq = ListSequenceGenerator(100)
+    list_seq.generate_range_sequence('xml', 0, 10, 2)
+    for args in ((0, 30, 3), (0, 20, 3), (1, 40, 3)):
+        inode = os.stat(PATH_XML).st_ino
+        list_seq.generate_range_sequence('xml', *args)
+        assert os.stat(PATH_XML).st_ino != inode, 'Not an extension'
+        assert list_seq.get_sequence() == list(range(*args)), 'Rewrite'
+    list_seq.generate_range_sequence('bin', 0, 2 ** 63, 2 ** 62)
+    for end in (5, 6):
+        inode = os.stat(PATH_BIN).st_ino
+        list_seq.generate_range_sequence('bin', 0, 2 ** 62 * end, 2 ** 62)
+        assert os.stat(PATH_BIN).st_ino != inode, 'Escapes appended'
+        assert list_seq.get_sequence() == list(
+            range(0, 2 ** 62 * end, 2 ** 62)
+        ), 'Escaped binary rewrite'
+    try:
+        list_seq.generate_range_sequence('json', 0, 10)
+        list_seq.generate_range_sequence('json', 0, 101)
+    except Exception as e:
+        assert isinstance(e, InvalidSequenceLen), 'InvalidSequenceLen'
+    assert list_seq.get_sequence() == list(range(10)), 'Append past limit'
+
+
+def test_read_cache():
+    for file_type in ('json', 'xml', 'bin', 'gzip'):
+        READ_CACHE.clear()
+        ListSequenceGenerator().generate_range_sequence(file_type, 0, 50)
+        list_seq = ListSequenceGenerator().get_sequence()
+        assert READ_CACHE.stats()['payloads'] == 0, 'Racy file cached'
+        time.sleep(RACY_WINDOW_NS / 10 ** 9)
+        assert ListSequenceGenerator().get_sequence() == list_seq, 'Miss'
+        list_seq.append(50)
+        assert ListSequenceGenerator().get_sequence() == list(
+            range(50)
+        ), 'Cached list is shared'
+        tuple_seq = TupleSequenceGenerator().get_sequence()
+        assert tuple_seq is TupleSequenceGenerator().get_sequence(), (
+            'Cached tuple is copied'
+        )
+        assert SetSequenceGenerator().get_sequence() == set(range(50)), (
+            'Cached set'
+        )
+        assert READ_CACHE.stats()['hits'] == 4, 'Read cache hits'
+        assert READ_CACHE.stats()['misses'] == 1, 'Read cache misses'
+        for generator, exception in (
+                (ListSequenceGenerator(10), InvalidSequenceLen),
+                (DictSequenceGenerator(), BadSeqType)
+        ):
+            try:
+                generator.get_sequence()
+            except Exception as e:
+                assert isinstance(e, exception), 'Cached sequence validation'
+            else:
+                assert False, 'Cached sequence validation'
+
+    READ_CACHE.clear()
+    DictSequenceGenerator().generate_range_sequence('xml', 0, 5)
+    time.sleep(RACY_WINDOW_NS / 10 ** 9)
+    dict_seq = DictSequenceGenerator().get_sequence()
+    dict_seq['5'] = 5
+    assert DictSequenceGenerator().get_sequence() == {
+        str(i): i for i in range(5)
+    }, 'Cached dict is shared'
+    DictSequenceGenerator().generate_range_sequence('xml', 0, 7)
+    time.sleep(RACY_WINDOW_NS / 10 ** 9)
+    assert len(DictSequenceGenerator().get_sequence()) == 7, 'Stale entry'
+    assert READ_CACHE.stats()['misses'] == 2, 'Append did not invalidate'
+
+    small_cache = ReadCache(ReadCache._payload_size(('list', 'x', (1, 2))))
+    small_cache.put(1, ('list', 'x', (1, 2)))
+    small_cache.put(2, ('list', 'x', (3, 4)))
+    small_cache.put(3, ('list', 'x', tuple(range(3))))
+    assert small_cache.get(1) is None and small_cache.get(2), 'LRU eviction'
+    assert small_cache.stats()['size'] <= small_cache.max_bytes, 'Budget'
+
+
+def test_serialisers():
+    import subprocess
+
+    loaded = subprocess.run([
+        sys.executable, '-c', 'import sys, json_and_xml; print(sorted('
+        '{"orjson", "lxml", "xml.etree.ElementTree"} & set(sys.modules)))'
+    ], cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True,
+        text=True, check=True).stdout
+    assert loaded.strip() == '[]', 'Serialiser backends are loaded eagerly'
+    backends = {
+        file_type: SERIALISERS.available(file_type)
+        for file_type in ('json', 'xml')
+    }
+    assert backends['json'][-1] == 'json', 'Stdlib json fallback'
+    assert backends['xml'][-1] == 'xml.etree.ElementTree', 'Stdlib fallback'
+    cases = (
+        (ListSequenceGenerator, 'generate_range_sequence', (-5, 40, 3)),
+        (TupleSequenceGenerator, 'generate_fibonacci_sequence',
+         ((2, 5), 120)),
+        (SetSequenceGenerator, 'generate_range_sequence', (0, 30)),
+        (DictSequenceGenerator, 'generate_range_sequence', (1, 20, 2))
+    )
+    try:
+        for file_type, names in backends.items():
+            file_path = FILE_PATHS[file_type]
+            for generator_class, method, args in cases:
+                files = []
+                for name in names:
+                    SERIALISERS.use(file_type, name)
+                    _remove_files(file_path)
+                    GENERATION_CACHE.clear()
+                    getattr(generator_class(200), method)(file_type, *args)
+                    with open(file_path, 'rb') as file:
+                        files.append(file.read())
+                for content in files:
+                    with open(file_path, 'wb') as file:
+                        file.write(content)
+                    sequences = []
+                    for name in names:
+                        SERIALISERS.use(file_type, name)
+                        READ_CACHE.clear()
+                        sequences.append(generator_class(200).get_sequence())
+                    assert sequences == [sequences[0]] * len(names), (
+                        'Backends are not interchangeable'
+                    )
+                assert len(set(
+                    re.split(rb'"meta"|<meta>', content)[0]
+                    for content in files
+                )) == 1, 'Backends wrote different sequences'
+        try:
+            SERIALISERS.use('json', 'simplejson')
+        except Exception as e:
+            assert isinstance(e, InvalidArgumentValueError), 'Unknown backend'
+        try:
+            SERIALISERS.available('yaml')
+        except Exception as e:
+            assert isinstance(e, InvalidFileTypeArgument), 'Unknown file type'
+    finally:
+        for file_type in backends:
+            SERIALISERS.use(file_type)
+    assert SERIALISERS.get('json').name == backends['json'][0], 'Auto pick'
+
+
+def test_import_time():
+    import subprocess
+
+    loaded = subprocess.run([
+        sys.executable, '-c', 'import sys, json_and_xml; print(sorted({'
+        '"asyncio", "concurrent.futures", "xml.sax.saxutils", "subprocess"'
+        '} & set(sys.modules)))'
+    ], cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True,
+        text=True, check=True).stdout
+    assert loaded.strip() == '[]', 'Heavy modules are imported eagerly'
+    assert _escape_xml('<a & "b">') == '&lt;a &amp; "b"&gt;', 'XML escape'
+
+
+def test_compact_dict():
+    elements = [5, -3, 2, -1, 1, 0, 1, 1, 2, 3]
+    compact = CompactDictView(elements)
+    expected = {str(i): i for i in elements}
+    assert compact == expected and expected == compact, 'Dict equality'
+    assert list(compact) == list(expected), 'Insertion order'
+    assert list(compact.keys()) == list(expected.keys()), 'Keys'
+    assert list(compact.values()) == list(expected.values()), 'Values'
+    assert list(compact.items()) == list(expected.items()), 'Items'
+    assert compact == CompactDictView(reversed(elements)), 'Compact equality'
+    assert compact != CompactDictView(elements[:-1]), 'Compact inequality'
+    assert compact['-3'] == -3 and compact.get('4') is None, 'Lookup'
+    for key in ('05', '+5', ' 5', 5, 'five', None, '4'):
+        assert key not in compact, 'Invalid key lookup'
+    try:
+        compact['1'] = 1
+    except Exception as e:
+        assert isinstance(e, TypeError), 'Compact dict is read-only'
+
+    for file_type in ('json', 'xml', 'bin', 'gzip'):
+        DictSequenceGenerator(1000).generate_range_sequence(
+            file_type, -50, 5000, 7
+        )
+        sequence = DictSequenceGenerator(1000).get_sequence()
+        compact = DictSequenceGenerator(1000).get_sequence(compact=True)
+        assert type(sequence) is dict, 'Default dict sequence'
+        assert isinstance(compact, CompactDictView), 'Compact sequence'
+        assert compact == sequence, 'Compact sequence differs'
+        assert list(compact.items()) == list(sequence.items()), 'Order'
+    dict_size = sys.getsizeof(sequence) + sum(
+        sys.getsizeof(key) + sys.getsizeof(value)
+        for key, value in sequence.items()
+    )
+    assert sys.getsizeof(compact) * 4 < dict_size, 'Compact dict memory'
+
+    DictSequenceGenerator().generate_range_sequence(
+        'xml', 2 ** 63 - 2, 2 ** 63 + 2
+    )
+    sequence = DictSequenceGenerator().get_sequence(compact=True)
+    assert sequence == {
+        str(i): i for i in range(2 ** 63 - 2, 2 ** 63 + 2)
+    } and type(sequence) is dict, 'Big int dict fallback'
+
+
+def test_memory_budget():
+    import tracemalloc
+    seq_len = 5 * 10 ** 4
+    budget = 100 * seq_len
+    for generator_class, container in (
+            (ListSequenceGenerator, list), (TupleSequenceGenerator, tuple)
+    ):
+        for file_type in ('json', 'xml', 'bin', 'gzip'):
+            generator = generator_class(seq_len, memory_budget=budget)
+            tracemalloc.start()
+            generator.generate_range_sequence(
+                file_type, 10 ** 6, 10 ** 6 + 90 * seq_len, 90
+            )
+            generation_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.reset_peak()
+            sequence = generator.get_sequence()
+            reading_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            sequence_size = sys.getsizeof(sequence) + sum(
+                sys.getsizeof(element) for element in sequence
+            )
+            assert sequence == container(
+                range(10 ** 6, 10 ** 6 + 90 * seq_len, 90)
+            ), 'Budget sequence'
+            assert generation_peak < sequence_size / 2, 'Generation buffered'
+            assert reading_peak < 3 * sequence_size, (
+                'Reading peak is not bounded by the sequence size'
+            )
+            assert (
+                generator.sequence, generator.loaded_data,
+                generator.seq_from_file
+            ) == (None, None, None), 'Buffers were not released'
+
+    small_budget = 10 ** 4
+    tracemalloc.start()
+    for generator, method, args in (
+            (ListSequenceGenerator(seq_len, memory_budget=small_budget),
+             'get_sequence', ()),
+            (SetSequenceGenerator(seq_len, memory_budget=small_budget),
+             'generate_fibonacci_sequence', ('json', (2, 3), seq_len)),
+            (DictSequenceGenerator(seq_len, memory_budget=small_budget),
+             'generate_fibonacci_sequence', ('xml', (2, 3), 1000))
+    ):
+        try:
+            getattr(generator, method)(*args)
+        except Exception as e:
+            assert isinstance(e, MemoryBudgetExceeded), 'Memory budget'
+        else:
+            assert False, 'Memory budget was not enforced'
+    failed_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert failed_peak < small_budget * 10, 'Budget failure was not early'
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = SequenceStore(directory)
+        bundle = SequenceBundle(os.path.join(directory, 'bundle.json'))
+        read_len = 2 * CHUNK_SIZE
+        bundle.generate([
+            ('seq', ListSequenceGenerator(read_len), 'range', (0, read_len))
+        ])
+        for file_type in ('json', 'xml', 'bin', 'gzip'):
+            ListSequenceGenerator(read_len).generate_range_sequence(
+                file_type, 0, read_len
+            )
+            store.generate_range_sequence(
+                file_type, ListSequenceGenerator(read_len), file_type,
+                0, read_len
+            )
+            for file_path in (
+                    FILE_PATHS[file_type],
+                    store._file_paths(file_type)[file_type]
+            ):
+                os.remove(file_path + HEADER_SUFFIX)
+            for read in (
+                    lambda generator: generator.get_sequence(),
+                    lambda generator: store.get_sequence(file_type, generator),
+                    lambda generator: bundle.get_sequence('seq', generator)
+            ):
+                try:
+                    read(ListSequenceGenerator(
+                        read_len, memory_budget=small_budget
+                    ))
+                except Exception as e:
+                    assert isinstance(e, MemoryBudgetExceeded), (
+                        'Read budget without header'
+                    )
+                else:
+                    assert False, 'Read budget without header'
+    for memory_budget, exception in (
+            (0, InvalidArgumentValueError), (1.5, IncorrectArgumentTypeError),
+            (True, IncorrectArgumentTypeError)
+    ):
+        try:
+            ListSequenceGenerator(memory_budget=memory_budget)
+        except Exception as e:
+            assert isinstance(e, exception), 'Invalid memory budget'
+        else:
+            assert False, 'Invalid memory budget'
+
+
+def test_observers():
+    events = []
+    generator = ListSequenceGenerator()
+    generator.add_observer(events.append)
+    generator.generate_range_sequence('json', 0, 100)
+    phases = [event['phase'] for event in events if event['event'] == 'phase']
+    assert phases[:2] == ['generate', 'serialise'], 'Generation phases'
+    assert 'header' in phases, 'Header phase'
+    serialise = next(x for x in events if x.get('phase') == 'serialise')
+    assert serialise['bytes_written'] == os.path.getsize(
+        FILE_PATHS['json']
+    ), 'Bytes written'
+    assert serialise['generator'] == 'ListSequenceGenerator', 'Generator'
+    assert serialise['seconds'] >= 0, 'Phase timing'
+    assert {'event': 'cache', 'cache': 'payload', 'outcome': 'miss',
+            'generator': 'ListSequenceGenerator'} in events, 'Cache outcome'
+    del events[:]
+    generator.get_sequence()
+    parse = next(x for x in events if x.get('phase') == 'parse')
+    assert parse['bytes_read'] == os.path.getsize(FILE_PATHS['json']), (
+        'Bytes read'
+    )
+    generator.remove_observer(events.append)
+    del events[:]
+    generator.get_sequence()
+    assert events == [], 'Removed observer was called'
+    assert ListSequenceGenerator()._phase('parse') is NO_PHASE, (
+        'Phase timer without observers'
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        jsonl_path = os.path.join(directory, 'metrics.jsonl')
+        prometheus_path = os.path.join(directory, 'metrics.prom')
+        with MetricsExporter(jsonl_path) as jsonl_exporter, MetricsExporter(
+                prometheus_path, 'prometheus'
+        ) as prometheus_exporter:
+            OBSERVERS.extend((jsonl_exporter, prometheus_exporter))
+            try:
+                TupleSequenceGenerator().generate_range_sequence('bin', 0, 50)
+                TupleSequenceGenerator().get_sequence()
+            finally:
+                del OBSERVERS[:]
+        with open(jsonl_path) as file:
+            jsonl_events = [json.loads(line) for line in file]
+        assert {x.get('phase') for x in jsonl_events} >= {
+            'generate', 'serialise', 'header', 'parse'
+        }, 'JSON lines phases'
+        with open(prometheus_path) as file:
+            prometheus_lines = file.read().splitlines()
+        assert '# TYPE sequence_phase_seconds_total counter' in (
+            prometheus_lines
+        ), 'Prometheus metric type'
+        assert (
+            'sequence_phase_calls_total{generator="TupleSequenceGenerator",'
+            'phase="parse"} 1'
+        ) in prometheus_lines, 'Prometheus phase calls'
+        assert (
+            'sequence_bytes_read_total{generator="TupleSequenceGenerator"} '
+            f'{os.path.getsize(FILE_PATHS["bin"])}'
+        ) in prometheus_lines, 'Prometheus bytes read'
+    try:
+        MetricsExporter('metrics', 'csv')
+    except Exception as e:
+        assert isinstance(e, InvalidArgumentValueError), 'Metrics format'
+    else:
+        assert False, 'Metrics format'
+
+
+def test_bundle():
+    with tempfile.TemporaryDirectory() as directory:
+        bundle = SequenceBundle(os.path.join(directory, 'bundle.json'))
+        list_seq = ListSequenceGenerator(10 ** 4)
+        specs = [
+            (f'range_{i}', list_seq, 'range', (0, i))
+            for i in range(1, 1001)
+        ] + [
+            ('tuple', TupleSequenceGenerator(), 'fibonacci', ((1, 2), 20)),
+            ('set', SetSequenceGenerator(), 'range', (5, 50, 5)),
+            ('dict', DictSequenceGenerator(), 'range', (0, 10)),
+            ('stream', ListSequenceGenerator(memory_budget=10 ** 6),
+             'range', (0, 100))
+        ]
+        events = []
+        list_seq.add_observer(events.append)
+        bundle.generate(specs)
+        list_seq.remove_observer(events.append)
+        assert sorted(os.listdir(directory)) == ['bundle.json'], (
+            'Bundle files'
+        )
+        assert not os.path.isfile(PATH_JSON), 'Bundle wrote sequence file'
+        assert not any(
+            x.get('phase') == 'serialise' for x in events
+        ), 'Bundle serialised separate documents'
+        assert len(bundle) == len(specs), 'Bundle length'
+        assert 'set' in bundle and 'missing' not in bundle, 'Bundle names'
+        with open(bundle.path) as file:
+            data = json.load(file)
+        dates = {
+            (entry['meta']['date_created'], entry['meta']['date_modified'])
+            for entry in data['sequences'].values()
+        }
+        assert len(dates) == 1, 'Metadata timestamp snapshot'
+        assert data['meta']['seq_count'] == len(specs), 'Bundle meta'
+        assert bundle.get_sequence('range_1000', list_seq) == list(
+            range(1000)
+        ), 'Bundle range sequence'
+        stored = bundle.get_sequence('range_10', list_seq)
+        stored.append(10)
+        assert bundle.get_sequence('range_10', list_seq) == list(
+            range(10)
+        ), 'Bundle entry is shared'
+        assert bundle.get_sequence('tuple', TupleSequenceGenerator()) == (
+            tuple(BaseSequenceGenerator.fibonacci_window((1, 2), 0, 20))
+        ), 'Bundle fibonacci sequence'
+        assert bundle.get_sequence('set', SetSequenceGenerator()) == set(
+            range(5, 50, 5)
+        ), 'Bundle set sequence'
+        assert bundle.get_sequence('dict', DictSequenceGenerator()) == {
+            str(i): i for i in range(10)
+        }, 'Bundle dict sequence'
+        assert bundle.get_sequence('stream', ListSequenceGenerator()) == (
+            list(range(100))
+        ), 'Bundle streamed sequence'
+        assert list_seq.bundle is None, 'Generator left bound to bundle'
+        for name, generator, exception in (
+                ('missing', ListSequenceGenerator(), SequenceNotFound),
+                ('range_1000', ListSequenceGenerator(), InvalidSequenceLen),
+                ('dict', ListSequenceGenerator(), BadSeqType),
+                ('tuple', SetSequenceGenerator(),
+                 InappropriateTypeForFiboGeneration)
+        ):
+            try:
+                bundle.get_sequence(name, generator)
+            except Exception as e:
+                assert isinstance(e, exception), 'Bundle read validation'
+            else:
+                assert False, 'Bundle read validation'
+
+        import tracemalloc
+        seq_len = 3 * 10 ** 4
+        sequence_size = sys.getsizeof(list(range(seq_len))) + sum(
+            sys.getsizeof(element) for element in range(seq_len)
+        )
+        for name, generator, args in (
+                ('budget', ListSequenceGenerator(
+                    seq_len, memory_budget=10 ** 8
+                ), (0, seq_len)),
+                ('streamed', ListSequenceGenerator(seq_len),
+                 (0, seq_len, 1, True))
+        ):
+            streamed_bundle = SequenceBundle(
+                os.path.join(directory, 'streamed.json')
+            )
+            tracemalloc.start()
+            streamed_bundle.generate([(name, generator, 'range', args)])
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            assert peak < BUNDLE_BUFFER_SIZE + sequence_size / 4, (
+                'Bundle entry was buffered'
+            )
+            assert streamed_bundle.get_sequence(name, generator) == list(
+                range(seq_len)
+            ), 'Streamed bundle entry'
+        os.remove(streamed_bundle.path)
+
+        stored_data = data
+        for specs, exception in (
+                ([('a', ListSequenceGenerator(), 'range', (0, 10))] * 2,
+                 InvalidArgumentValueError),
+                ([('a', ListSequenceGenerator(), 'sum', (0, 10))],
+                 InvalidArgumentValueError),
+                ([('a', ListSequenceGenerator, 'range', (0, 10))],
+                 IncorrectArgumentTypeError),
+                ([('a', ListSequenceGenerator(), 'range', (0, 10)),
+                  ('b', ListSequenceGenerator(), 'range', (0, 101))],
+                 InvalidSequenceLen)
+        ):
+            try:
+                bundle.generate(specs)
+            except Exception as e:
+                assert isinstance(e, exception), 'Bundle spec validation'
+            else:
+                assert False, 'Bundle spec validation'
+        with open(bundle.path) as file:
+            assert json.load(file) == stored_data, 'Failed bulk is not atomic'
+        assert sorted(os.listdir(directory)) == ['bundle.json'], (
+            'Failed bundle left temporary files'
+        )
+
+
+def test_sequence_index():
+    _remove_files(*FILE_PATHS.values())
+    try:
+        SequenceIndex(ListSequenceGenerator())
+    except Exception as e:
+        assert isinstance(e, SequenceNotFound), 'Index without sequence'
+    else:
+        assert False, 'Index without sequence'
+    seq_len = 10 ** 4
+    elements = list(range(-seq_len, 2 * seq_len, 3))
+    random.shuffle(elements)
+    list_seq = ListSequenceGenerator(seq_len)
+    list_seq.sequence = tuple(elements)
+    list_seq.min, list_seq.max = min(elements), max(elements)
+    list_seq.len = len(elements)
+    list_seq._generate_sequence('bin')
+    with SequenceIndex(ListSequenceGenerator(seq_len)) as index:
+        assert len(index) == len(elements), 'Index length'
+        assert os.path.isfile(PATH_BIN + INDEX_SUFFIX), 'Index file'
+        for element in (-seq_len, -seq_len + 1, 2 * seq_len - 1, 2 ** 70):
+            assert index.contains(element) == (element in elements), (
+                'Index contains'
+            )
+        assert index.range(-10, 10) == sorted(
+            x for x in elements if -10 <= x < 10
+        ), 'Index range'
+        assert index.count_between(0, 1000) == len(
+            [x for x in elements if 0 <= x < 1000]
+        ), 'Index count'
+        assert index.count_between(5, 5) == 0, 'Empty index bounds'
+        for args, exception in (
+                ((1.5, 2), IncorrectArgumentTypeError),
+                ((True, 2), IncorrectArgumentTypeError),
+                ((3, 2), InvalidArgumentValueError)
+        ):
+            try:
+                index.count_between(*args)
+            except Exception as e:
+                assert isinstance(e, exception), 'Index bounds'
+            else:
+                assert False, 'Index bounds'
+
+    events = []
+    generator = ListSequenceGenerator(seq_len)
+    generator.add_observer(events.append)
+    with SequenceIndex(generator) as index:
+        assert index.contains(elements[0]), 'Stored index'
+    assert not any(x.get('phase') == 'parse' for x in events), (
+        'Stored index was rebuilt'
+    )
+    ListSequenceGenerator(seq_len).generate_range_sequence('bin', 0, 50)
+    with SequenceIndex(generator) as index:
+        assert index.range(-100, 100) == list(range(50)), 'Stale index'
+    assert any(x.get('phase') == 'parse' for x in events), (
+        'Stale index was not rebuilt'
+    )
+
+    with SequenceIndex(ListSequenceGenerator()) as index:
+        assert index.contains(49), 'Index before format switch'
+        ListSequenceGenerator().generate_range_sequence('gzip', 0, 70)
+        assert index.contains(69), 'Index after format switch'
+        assert index.source_path == PATH_GZIP, 'Index source after switch'
+        ListSequenceGenerator().generate_range_sequence('json', 10, 20)
+        assert not os.path.isfile(PATH_GZIP + INDEX_SUFFIX), 'Index was left'
+        assert index.range(0, 15) == list(range(10, 15)), 'Json index'
+        _remove_files(PATH_JSON)
+        try:
+            index.contains(10)
+        except Exception as e:
+            assert isinstance(e, SequenceNotFound), 'Removed sequence'
+        else:
+            assert False, 'Removed sequence'
+    DictSequenceGenerator().generate_range_sequence('json', 10, 20)
+    with SequenceIndex(DictSequenceGenerator()) as index:
+        assert index.range(0, 15) == list(range(10, 15)), 'Dict index'
+    ListSequenceGenerator(300).generate_fibonacci_sequence('xml', (1, 1), 300)
+    fibonacci = list(BaseSequenceGenerator.fibonacci_window((1, 1), 0, 300))
+    with SequenceIndex(ListSequenceGenerator(300)) as index:
+        assert index.contains(fibonacci[-1]), 'Wide index contains'
+        assert not index.contains(fibonacci[-1] + 1), 'Wide index contains'
+        assert index.count_between(1, 2) == 2, 'Index duplicates'
+        assert index.range(10 ** 40, 10 ** 42) == [
+            x for x in fibonacci if 10 ** 40 <= x < 10 ** 42
+        ], 'Wide index range'
+
+
 if __name__ == '__main__':
     test_positive()
     test_negative()
+    test_stream_json()
+    test_stream_xml()
+    test_serialise_xml()
+    test_header()
+    test_generation_cache()
+    test_binary()
+    test_packed()
+    test_range_storage()
+    test_fibonacci_engine()
+    test_parallel()
+    test_async()
+    test_store()
+    test_append()
+    test_read_cache()
+    test_serialisers()
+    test_import_time()
+    test_compact_dict()
+    test_memory_budget()
+    test_observers()
+    test_bundle()
+    test_sequence_index()
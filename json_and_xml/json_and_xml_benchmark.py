@@ -0,0 +1,332 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+from json_and_xml import (
+    DATE_STAMP, FILE_PATHS, GENERATION_CACHE, READ_CACHE,
+    DictSequenceGenerator, ListSequenceGenerator, SetSequenceGenerator,
+    TupleSequenceGenerator, _remove_files
+)
+
+
+GENERATOR_CLASSES = (
+    ListSequenceGenerator, TupleSequenceGenerator, SetSequenceGenerator,
+    DictSequenceGenerator
+)
+FILE_TYPES = ('json', 'xml', 'bin', 'gzip', 'bz2', 'lzma')
+SIZES = tuple(10 ** power for power in range(2, 8))
+FIBONACCI_MAX_SIZE = 10 ** 4
+FIBONACCI_PAIR = (1, 2)
+REGRESSION_THRESHOLD = 0.1
+METRICS = (
+    'generate_seconds', 'get_seconds', 'generate_peak_bytes',
+    'get_peak_bytes'
+)
+
+
+def _clean_state():
+    for path in FILE_PATHS.values():
+        _remove_files(path)
+    GENERATION_CACHE.clear()
+    READ_CACHE.clear()
+
+
+def _run_phase(generator, method, *args, trace_memory=False):
+    events = []
+    generator.add_observer(events.append)
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    getattr(generator, method)(*args)
+    seconds = time.perf_counter() - start
+    peak = None
+    if trace_memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    generator.remove_observer(events.append)
+    phase_seconds = {}
+    for event in events:
+        if event['event'] == 'phase':
+            phase_seconds[event['phase']] = phase_seconds.get(
+                event['phase'], 0
+            ) + event['seconds']
+    return seconds, peak, phase_seconds
+
+
+def _bench_case(generator_class, method, file_type, size, trace_memory):
+    _clean_state()
+    generator = generator_class(size)
+    if method == 'range':
+        generate = ('generate_range_sequence', file_type, 0, size)
+    else:
+        generate = (
+            'generate_fibonacci_sequence', file_type, FIBONACCI_PAIR, size
+        )
+    generate_seconds, generate_peak, generate_phases = _run_phase(
+        generator, *generate, trace_memory=trace_memory
+    )
+    phase_seconds = {
+        f'generate.{phase}': seconds
+        for phase, seconds in generate_phases.items()
+    }
+    if method == 'fibonacci' and generator_class in (
+            SetSequenceGenerator, DictSequenceGenerator
+    ):
+        return generate_seconds, generate_peak, None, None, phase_seconds
+    get_seconds, get_peak, get_phases = _run_phase(
+        generator_class(size), 'get_sequence', trace_memory=trace_memory
+    )
+    phase_seconds.update(
+        (f'get.{phase}', seconds) for phase, seconds in get_phases.items()
+    )
+    return generate_seconds, generate_peak, get_seconds, get_peak, (
+        phase_seconds
+    )
+
+
+def bench_cases(sizes=SIZES, generator_classes=GENERATOR_CLASSES,
+                file_types=FILE_TYPES):
+    for generator_class in generator_classes:
+        for method in ('range', 'fibonacci'):
+            for file_type in file_types:
+                for size in sizes:
+                    if method == 'fibonacci' and size > FIBONACCI_MAX_SIZE:
+                        continue
+                    yield generator_class, method, file_type, size
+
+
+def run_benchmarks(sizes=SIZES, generator_classes=GENERATOR_CLASSES,
+                   file_types=FILE_TYPES, repeat=3, trace_memory=True,
+                   directory=None):
+    results = []
+    working_directory = os.getcwd()
+    with tempfile.TemporaryDirectory(dir=directory) as bench_directory:
+        os.chdir(bench_directory)
+        try:
+            for generator_class, method, file_type, size in bench_cases(
+                    sizes, generator_classes, file_types
+            ):
+                timings = [
+                    _bench_case(
+                        generator_class, method, file_type, size, False
+                    ) for _ in range(repeat)
+                ]
+                generate_seconds = min(timing[0] for timing in timings)
+                get_seconds = None
+                if timings[0][2] is not None:
+                    get_seconds = min(timing[2] for timing in timings)
+                generate_peak = get_peak = None
+                phase_seconds = {
+                    phase: min(timing[4][phase] for timing in timings)
+                    for phase in timings[0][4]
+                }
+                if trace_memory:
+                    _, generate_peak, _, get_peak, _ = _bench_case(
+                        generator_class, method, file_type, size, True
+                    )
+                results.append({
+                    'generator': generator_class.__name__,
+                    'method': method,
+                    'file_type': file_type,
+                    'size': size,
+                    'generate_seconds': generate_seconds,
+                    'get_seconds': get_seconds,
+                    'generate_throughput': size / generate_seconds,
+                    'get_throughput': get_seconds and size / get_seconds,
+                    'generate_peak_bytes': generate_peak,
+                    'get_peak_bytes': get_peak,
+                    'phase_seconds': phase_seconds
+                })
+        finally:
+            _clean_state()
+            os.chdir(working_directory)
+    return {
+        'meta': {
+            'date_created': datetime.now().strftime(DATE_STAMP),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': repeat
+        },
+        'results': results
+    }
+
+
+def _result_key(result):
+    return (
+        result['generator'], result['method'], result['file_type'],
+        result['size']
+    )
+
+
+def compare_results(baseline, current, threshold=REGRESSION_THRESHOLD):
+    baseline_results = {
+        _result_key(result): result for result in baseline['results']
+    }
+    regressions = []
+    for result in current['results']:
+        stored = baseline_results.get(_result_key(result))
+        if stored is None:
+            continue
+        metrics = [
+            (metric, stored.get(metric), result.get(metric))
+            for metric in METRICS
+        ]
+        stored_phases = stored.get('phase_seconds', {})
+        result_phases = result.get('phase_seconds', {})
+        metrics += [
+            (phase, stored_phases[phase], result_phases.get(phase))
+            for phase in sorted(stored_phases)
+        ]
+        for metric, stored_value, value in metrics:
+            if stored_value and value and (
+                value > stored_value * (1 + threshold)
+            ):
+                regressions.append(
+                    _result_key(result) + (metric, stored_value, value)
+                )
+    return regressions
+
+
+def _write_results(results, path):
+    with open(path, 'w') as file:
+        json.dump(results, file, indent=2)
+
+
+def _read_results(path):
+    with open(path, 'r') as file:
+        return json.load(file)
+
+
+def _format_result(result):
+    get_seconds = result['get_seconds']
+    return (
+        f"{result['generator']:<24}{result['method']:<11}"
+        f"{result['file_type']:<6}{result['size']:>10}"
+        f"{result['generate_seconds']:>12.4f}"
+        f"{'-' if get_seconds is None else f'{get_seconds:.4f}':>12}"
+        f"{result['generate_throughput']:>14.0f}"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Benchmark json_and_xml sequence generators'
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+    run_parser = commands.add_parser('run', help='run benchmarks')
+    run_parser.add_argument('--output', default='benchmark.json')
+    run_parser.add_argument(
+        '--sizes', type=int, nargs='+', default=list(SIZES)
+    )
+    run_parser.add_argument(
+        '--file-types', nargs='+', choices=FILE_TYPES,
+        default=list(FILE_TYPES)
+    )
+    run_parser.add_argument(
+        '--generators', nargs='+',
+        choices=[x.__name__ for x in GENERATOR_CLASSES],
+        default=[x.__name__ for x in GENERATOR_CLASSES]
+    )
+    run_parser.add_argument('--repeat', type=int, default=3)
+    run_parser.add_argument('--no-memory', action='store_true')
+    compare_parser = commands.add_parser(
+        'compare', help='fail when current results regress'
+    )
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument(
+        '--threshold', type=float, default=REGRESSION_THRESHOLD
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        results = run_benchmarks(
+            args.sizes, [
+                x for x in GENERATOR_CLASSES if x.__name__ in args.generators
+            ], args.file_types, args.repeat, not args.no_memory
+        )
+        for result in results['results']:
+            print(_format_result(result))
+        _write_results(results, args.output)
+        return 0
+    regressions = compare_results(
+        _read_results(args.baseline), _read_results(args.current),
+        args.threshold
+    )
+    for generator, method, file_type, size, metric, stored, current in (
+            regressions
+    ):
+        print(
+            f'{generator} {method} {file_type} {size} {metric}: '
+            f'{stored:.6g} -> {current:.6g} '
+            f'(+{(current / stored - 1) * 100:.1f}%)'
+        )
+    return 1 if regressions else 0
+
+
+def test_run_benchmarks():
+    stored_files = sorted(os.listdir())
+    results = run_benchmarks(sizes=(100, 1000), repeat=1)
+    assert sorted(os.listdir()) == stored_files, 'Benchmark files left'
+    assert len(results['results']) == (
+        len(GENERATOR_CLASSES) * 2 * len(FILE_TYPES) * 2
+    ), 'Benchmark cases'
+    for result in results['results']:
+        phase_seconds = result['phase_seconds']
+        assert result['generate_seconds'] > 0, 'Generate timing'
+        assert result['generate_peak_bytes'] > 0, 'Generate peak memory'
+        assert phase_seconds['generate.serialise'] > 0, 'Serialise timing'
+        assert phase_seconds['generate.header'] > 0, 'Header timing'
+        assert sum(
+            seconds for phase, seconds in phase_seconds.items()
+            if phase.startswith('generate.')
+        ) <= result['generate_seconds'], 'Generate phases'
+        if result['method'] == 'fibonacci' and result['generator'] in (
+                'SetSequenceGenerator', 'DictSequenceGenerator'
+        ):
+            assert result['get_seconds'] is None, 'Unreadable sequence'
+        else:
+            assert result['get_seconds'] > 0, 'Get timing'
+            assert result['get_peak_bytes'] > 0, 'Get peak memory'
+            assert phase_seconds['get.parse'] > 0, 'Parse timing'
+
+
+def test_compare_results():
+    with tempfile.TemporaryDirectory() as directory:
+        baseline_path = os.path.join(directory, 'baseline.json')
+        current_path = os.path.join(directory, 'current.json')
+        assert main([
+            'run', '--output', baseline_path, '--sizes', '100',
+            '--file-types', 'json', '--generators', 'ListSequenceGenerator',
+            '--repeat', '1'
+        ]) == 0, 'Benchmark run'
+        baseline = _read_results(baseline_path)
+        assert main(['compare', baseline_path, baseline_path]) == 0, (
+            'Identical results regressed'
+        )
+        baseline['results'][0]['generate_seconds'] /= 2
+        baseline['results'][0]['get_peak_bytes'] //= 2
+        baseline['results'][0]['phase_seconds']['get.parse'] /= 2
+        _write_results(baseline, current_path)
+        assert main(['compare', current_path, baseline_path]) == 1, (
+            'Regression was not detected'
+        )
+        regressions = compare_results(
+            baseline, _read_results(baseline_path)
+        )
+        assert {regression[4] for regression in regressions} == {
+            'generate_seconds', 'get_peak_bytes', 'get.parse'
+        }, 'Regressed metrics'
+        assert compare_results(
+            baseline, _read_results(baseline_path), threshold=10
+        ) == [], 'Regression threshold'
+
+
+if __name__ == '__main__':
+    sys.exit(main())